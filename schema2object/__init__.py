@@ -1,4 +1,4 @@
 """schema2object — JSON Schema as object definition."""
-from .tree import ObjectTree, ObjectTreeEncoder
+from .tree import ObjectTree, ObjectTreeColumnar, ObjectTreeEncoder, dumps, path
 
-__all__ = ['ObjectTree', 'ObjectTreeEncoder']
+__all__ = ['ObjectTree', 'ObjectTreeColumnar', 'ObjectTreeEncoder', 'dumps', 'path']
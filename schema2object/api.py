@@ -10,13 +10,19 @@ Schema is ObjectTree. Keywords are attributes. Logic is methods.
   data.if_then()         -> method    -> conditional branch (CASE WHEN)
   data.project()         -> method    -> schema-defined fields (SELECT)
   data.contains()        -> method    -> array element check (EXISTS)
+
+  compile(schema)        -> function  -> reusable validate(value) -> (ok, reason)
 """
 from __future__ import annotations
 
+import builtins
 import math
 import re
 from collections.abc import Mapping, Sequence
-from typing import TYPE_CHECKING, Any
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, Callable, Iterator, NamedTuple
+from urllib.parse import unquote
 
 if TYPE_CHECKING:
     from .tree import ObjectTree
@@ -28,6 +34,84 @@ def _raw(v: Any) -> Any:
     return v.to_dict() if hasattr(v, 'to_dict') else v
 
 
+def _hashable(v: Any) -> Any:
+    """Hashable stand-in for a JSON value: dict -> frozenset, list -> tuple.
+
+    Raises TypeError for values that cannot be made hashable.
+    """
+    if isinstance(v, dict):
+        return frozenset((k, _hashable(x)) for k, x in v.items())
+    if isinstance(v, list):
+        return tuple(_hashable(x) for x in v)
+    hash(v)
+    return v
+
+
+class _LiteralPattern:
+    """Stand-in for re.Pattern when the pattern is a plain literal.
+
+    search() runs a str method (in / startswith / endswith / ==) instead of
+    the regex engine.
+    """
+
+    __slots__ = ('pattern', 'search')
+
+    def __init__(self, pattern: str, search: Callable[[str], bool]):
+        self.pattern = pattern
+        self.search = search
+
+
+def _literal_pattern(pat: str) -> _LiteralPattern | None:
+    """Matcher for 'lit', '^lit', 'lit$' or '^lit$' patterns, else None."""
+    body = pat
+    anchored_start = body.startswith('^')
+    if anchored_start:
+        body = body[1:]
+    anchored_end = body.endswith('$')
+    if anchored_end:
+        body = body[:-1]
+    if not body or re.escape(body) != body:
+        return None
+    # '$' also matches just before a trailing newline.
+    body_nl = body + '\n'
+    if anchored_start and anchored_end:
+        return _LiteralPattern(pat, lambda s: s == body or s == body_nl)
+    if anchored_start:
+        return _LiteralPattern(pat, lambda s: s.startswith(body))
+    if anchored_end:
+        return _LiteralPattern(pat, lambda s: s.endswith(body) or s.endswith(body_nl))
+    return _LiteralPattern(pat, lambda s: body in s)
+
+
+class _AnchoredPattern:
+    """Stand-in for re.Pattern when the regex can only match at position 0.
+
+    search() is the compiled pattern's match(), so a failing string is
+    rejected after one attempt instead of retrying at every offset.
+    """
+
+    __slots__ = ('pattern', 'search')
+
+    def __init__(self, compiled: re.Pattern):
+        self.pattern = compiled.pattern
+        self.search = compiled.match
+
+
+@lru_cache(maxsize=1024)
+def _compile_pattern(pat: str) -> re.Pattern | _LiteralPattern | _AnchoredPattern:
+    """Compile a pattern once; plain literals skip the regex engine entirely."""
+    literal = _literal_pattern(pat)
+    if literal is not None:
+        return literal
+    compiled = re.compile(pat)
+    # '^' pins every match to the start unless an alternative or an inline
+    # flag such as (?m) could change that; fullmatch is never substituted
+    # for '$', which also matches before a trailing newline.
+    if pat.startswith('^') and '|' not in pat and '(?' not in pat:
+        return _AnchoredPattern(compiled)
+    return compiled
+
+
 # --- Validation keywords: schema attribute -> value check ---
 
 _TYPE_MAP = {
@@ -40,6 +124,344 @@ _TYPE_MAP = {
     'null': type(None),
 }
 
+# Per-name type predicates; bool is never an integer/number. The exact-class
+# compare decides plain values; isinstance only runs for subclasses (IntEnum,
+# str enums), which stay accepted.
+_TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    'string': lambda v: v.__class__ is str or isinstance(v, str),
+    'integer': lambda v: v.__class__ is int or (
+        isinstance(v, int) and v.__class__ is not bool),
+    'number': lambda v: v.__class__ is int or v.__class__ is float or (
+        isinstance(v, (int, float)) and v.__class__ is not bool),
+    'boolean': lambda v: v.__class__ is bool,
+    'array': lambda v: isinstance(v, list),
+    'object': lambda v: isinstance(v, dict),
+    'null': lambda v: v is None,
+}
+
+_OK = (True, '')
+
+# Marks an absent keyword; keeps explicit falsy bounds such as 0 distinct.
+_UNSET = object()
+
+
+def _type_spec(st: Any) -> str | tuple:
+    """Hashable form of a type keyword (arrays become tuples)."""
+    return tuple(st) if isinstance(st, (list, tuple)) else st
+
+
+@lru_cache(maxsize=256)
+def _resolve_types(st: str | tuple) -> tuple[tuple[type, ...], bool]:
+    """Resolve a type spec to (allowed Python types, reject bool as numeric)."""
+    types = st if isinstance(st, tuple) else (st,)
+    reject_bool = 'boolean' not in types and not {'integer', 'number'}.isdisjoint(types)
+    allowed = []
+    for s in types:
+        mapped = _TYPE_MAP.get(s)
+        if mapped is not None:
+            if isinstance(mapped, tuple):
+                allowed.extend(mapped)
+            else:
+                allowed.append(mapped)
+    return tuple(allowed), reject_bool
+
+@lru_cache(maxsize=256)
+def _type_predicate(st: str | tuple) -> Callable[[Any], bool]:
+    """One predicate for a type spec: a table lookup, or any() over a union.
+
+    Unknown type names are ignored, matching _resolve_types.
+    """
+    types = st if isinstance(st, tuple) else (st,)
+    checks = tuple(_TYPE_CHECKS[s] for s in types if s in _TYPE_CHECKS)
+    if not checks:
+        return lambda v: True
+    if len(checks) == 1:
+        return checks[0]
+    return lambda v: any(check(v) for check in checks)
+
+Checker = Callable[[Any], 'tuple[bool, str]']
+Plan = 'dict[type | None, list[Checker]]'
+
+
+class _IdCache:
+    """Bounded cache keyed by object identity.
+
+    Holds a strong reference to each key so its id cannot be reused while
+    the entry is alive. Schemas are treated as immutable once validated.
+    """
+
+    __slots__ = ('_entries', '_maxsize')
+
+    def __init__(self, maxsize: int = 1024):
+        self._entries: dict[int, tuple[Any, Any]] = {}
+        self._maxsize = maxsize
+
+    def get(self, obj: Any) -> Any:
+        entry = self._entries.get(id(obj))
+        if entry is not None and entry[0] is obj:
+            return entry[1]
+        return None
+
+    def set(self, obj: Any, value: Any) -> Any:
+        if len(self._entries) >= self._maxsize:
+            self._entries.clear()
+        self._entries[id(obj)] = (obj, value)
+        return value
+
+
+_PLANS = _IdCache()
+
+
+def _unwrap_schema(schema: Any) -> Any:
+    """Deep plain copy of a schema with every ObjectTree node unwrapped.
+
+    Done once per compile so the plan builders never call _raw().
+    """
+    if hasattr(schema, 'to_dict'):
+        return schema.to_dict()
+    if isinstance(schema, Mapping):
+        return {k: _unwrap_schema(v) for k, v in schema.items()}
+    if isinstance(schema, list):
+        return [_unwrap_schema(v) for v in schema]
+    return schema
+
+
+_RESOLVED = _IdCache()
+
+
+def _resolved_plain(schema: Mapping) -> dict:
+    """Unwrapped copy of schema with local $refs resolved, built once per schema."""
+    plain = _RESOLVED.get(schema)
+    if plain is None:
+        plain = _RESOLVED.set(schema, _resolve_refs(_unwrap_schema(schema)))
+    return plain
+
+
+def _compile_schema(schema: Mapping) -> Plan:
+    """Return the checker plan for schema, building it on first use."""
+    plan = _PLANS.get(schema)
+    if plan is None:
+        plan = _PLANS.set(schema, _build_plan(_resolved_plain(schema)))
+    return plan
+
+
+def _compile_plain(schema: Mapping) -> Plan:
+    """_compile_schema for sub-schemas of an already unwrapped schema."""
+    plan = _PLANS.get(schema)
+    if plan is None:
+        plan = _PLANS.set(schema, _build_plan(schema))
+    return plan
+
+
+def _resolve_pointer(root: Any, ref: str) -> Any:
+    """Node of root addressed by a local JSON pointer ref ('#/a/0'), or None."""
+    node = root
+    for token in ref[2:].split('/') if ref != '#' else ():
+        token = unquote(token).replace('~1', '/').replace('~0', '~')
+        if isinstance(node, dict):
+            node = node.get(token)
+        elif isinstance(node, list) and token.isdigit() and int(token) < len(node):
+            node = node[int(token)]
+        else:
+            return None
+    return node
+
+
+def _resolve_refs(root: Any) -> Any:
+    """Point every local $ref of an unwrapped schema at its target node.
+
+    The string is replaced by the target dict itself, so the plan builder
+    links straight to the target's plan and validation never parses a
+    pointer. Recursive schemas become cyclic; only $ref edges close cycles.
+    Only '#' and '#/...' pointers are resolved. Other refs (remote, $id
+    anchors such as '#foo', or pointing outside a sub-schema compiled on its
+    own) are left as strings and ignored.
+    """
+    refs = [node for node in _schema_nodes(root) if _is_local_ref(node.get('$ref'))]
+    for node in refs:
+        target = _resolve_pointer(root, node['$ref'])
+        if isinstance(target, dict):
+            node['$ref'] = target
+    return root
+
+
+_PREPPED = _IdCache()
+
+# Keywords holding data rather than sub-schemas; never scanned for patterns.
+_DATA_KEYWORDS = frozenset({'const', 'enum', 'default', 'examples'})
+
+# Keywords whose value maps names (not keywords) to sub-schemas.
+_NAME_MAPS = frozenset({
+    'properties', 'patternProperties', 'definitions', '$defs',
+    'dependencies', 'dependentSchemas',
+})
+
+
+def _schema_nodes(root: Any) -> Iterator[dict]:
+    """Every dict schema node of a plain (acyclic) schema.
+
+    Data keywords are skipped only in keyword position: a property named
+    'default' or 'enum' is still a sub-schema.
+    """
+    stack = [(root, False)]
+    while stack:
+        node, names = stack.pop()
+        if isinstance(node, list):
+            stack.extend((v, False) for v in node)
+            continue
+        if not isinstance(node, dict):
+            continue
+        if not names:
+            yield node
+        for k, v in node.items():
+            if isinstance(v, (dict, list)) and (names or k not in _DATA_KEYWORDS):
+                stack.append((v, not names and k in _NAME_MAPS))
+
+
+def _is_local_ref(ref: Any) -> bool:
+    return isinstance(ref, str) and (ref == '#' or ref.startswith('#/'))
+
+
+def _prep_schema(schema: Mapping) -> None:
+    """Compile every pattern and patternProperties key of a schema up front.
+
+    Called when a schema is attached to an ObjectTree, so the first
+    validation does not pay for regex compilation. Runs once per schema
+    object; invalid patterns are left to fail at validation time.
+    """
+    if _PREPPED.get(schema) is not None:
+        return
+    _PREPPED.set(schema, True)
+    for node in _schema_nodes(_unwrap_schema(schema)):
+        pats = []
+        if isinstance(node.get('pattern'), str):
+            pats.append(node['pattern'])
+        pp = node.get('patternProperties')
+        if isinstance(pp, dict):
+            pats.extend(pp)
+        for pat in pats:
+            try:
+                _compile_pattern(pat)
+            except (re.error, TypeError):
+                pass
+
+
+_BUCKET_TYPES = (str, int, float, bool, type(None), list, dict)
+
+
+def _bucket_plan(entries: list[tuple[Checker, tuple | None, Any]]) -> Plan:
+    """Group checkers into per-type lists so dispatch is one dict lookup.
+
+    Each entry is (checker, bucket types, guard): bucket types None means
+    the checker applies to every value. Types outside _BUCKET_TYPES
+    (subclasses, ObjectTree) use the generic list under key None, where
+    checkers run behind an isinstance guard (unguarded if guard is None).
+    """
+    plan: Plan = {t: [] for t in _BUCKET_TYPES}
+    generic: list[Checker] = []
+    for check, buckets, guard in entries:
+        if buckets is None:
+            for checks in plan.values():
+                checks.append(check)
+            generic.append(check)
+            continue
+        for t in buckets:
+            plan[t].append(check)
+        generic.append(check if guard is None else _guarded(check, guard))
+    plan[None] = generic
+    return plan
+
+
+def _guarded(check: Checker, guard: Any) -> Checker:
+    def guarded(value):
+        if isinstance(value, guard):
+            return check(value)
+        return _OK
+    return guarded
+
+
+def _run_plan(plan: Plan, value: Any) -> tuple[bool, str]:
+    checks = plan.get(type(value))
+    if checks is None:
+        checks = plan[None]
+    for check in checks:
+        ok, reason = check(value)
+        if not ok:
+            return False, reason
+    return _OK
+
+
+def _keyword(schema: Mapping, kw: str) -> Any:
+    """Plain value of a keyword, or _UNSET if absent or null."""
+    v = schema.get(kw)
+    return _UNSET if v is None else v
+
+
+# Divisors with more decimal places than this keep the remainder check.
+_MAX_SCALE_DIGITS = 9
+
+
+def _multiple_checker(mo: int | float) -> Callable[[Any], bool]:
+    """multipleOf predicate specialized on the divisor's type.
+
+    A divisor with a short decimal form (0.1, 0.25, 1e-05) is scaled to an
+    integer once: value is a multiple when value * scale lands on an integer
+    (within the usual 1e-9 tolerance) that the scaled divisor divides
+    exactly; inf and nan are never multiples. Other divisors use
+    math.remainder.
+    """
+    def float_multiple(value):
+        remainder = math.remainder(value, mo)
+        return math.isclose(remainder, 0, abs_tol=1e-9)
+
+    if type(mo) is int:
+        scale, scaled_mo = 1, mo
+    else:
+        try:
+            exponent = Decimal(repr(mo)).as_tuple().exponent
+        except (InvalidOperation, TypeError, ValueError):
+            return float_multiple
+        if not isinstance(exponent, int) or -exponent > _MAX_SCALE_DIGITS:
+            return float_multiple
+        scale = 10 ** max(0, -exponent)
+        scaled_mo = round(mo * scale)
+        if not scaled_mo:
+            return float_multiple
+    tol = 1e-9 * scale
+    isfinite = math.isfinite
+
+    def scaled_multiple(value):
+        # Integer values against an integer divisor: exact modulo, no scaling
+        if type(value) is int and scale == 1:
+            return value % scaled_mo == 0
+        if not isfinite(value):
+            return False
+        scaled = value * scale
+        nearest = round(scaled)
+        return abs(scaled - nearest) <= tol and nearest % scaled_mo == 0
+    return scaled_multiple
+
+
+def _member_test(members: list) -> Callable[[Any], bool]:
+    """enum membership via a frozenset; list scan for unhashable members/values."""
+    try:
+        member_set = frozenset(members)
+    except TypeError:
+        return members.__contains__
+
+    def in_set(value):
+        try:
+            return value in member_set
+        except TypeError:
+            return value in members
+    return in_set
+
+
+# Exact types whose results validate_scalar may memoize (hashable, immutable)
+_SCALARS = frozenset({str, int, float, bool, type(None)})
+# Longer strings are validated directly: the memo bounds entries, not bytes
+_MEMO_MAX_LEN = 64
+
 
 def _check_value(schema: Mapping, value: Any) -> tuple[bool, str]:
     """Check value against Draft-07 schema constraints.
@@ -47,201 +469,1190 @@ def _check_value(schema: Mapping, value: Any) -> tuple[bool, str]:
     Returns (ok, reason). reason is empty on success.
     """
     if not isinstance(schema, Mapping):
-        return True, ''
+        return _OK
+    return _compiled_schema(schema).check(value)
+
+
+def compile(schema: Mapping, errors: str = 'verbose') -> Checker:
+    """Compile schema once into validate(value) -> (ok, reason).
+
+    Every keyword is resolved up front (constants bound, regexes compiled,
+    sub-schemas compiled), so each call only runs the checks. The result is
+    cached per schema object: compiling the same schema again is a lookup.
+    ObjectTree values are unwrapped; results for scalar values are memoized.
+
+        validate = compile({'type': 'integer', 'minimum': 0})
+        validate(5)    # (True, '')
+        validate(-1)   # (False, '-1 < minimum 0')
+
+    With ``errors='boolean'`` failures return ``(False, None)``: no reason
+    is formatted, for callers that only need the verdict.
+    """
+    if not isinstance(schema, Mapping):
+        raise TypeError(f"compile() expects a schema mapping, got {type(schema).__name__}")
+    if errors == 'verbose':
+        return _compiled_schema(schema).check
+    if errors != 'boolean':
+        raise ValueError(f"errors must be 'verbose' or 'boolean', got {errors!r}")
+    check = _BOOLEAN_CHECKS.get(schema)
+    if check is None:
+        check = _BOOLEAN_CHECKS.set(schema, _boolean_check(schema))
+    return check
+
+
+_FAILED = (False, None)
+_BOOLEAN_CHECKS = _IdCache()
+
+
+def _boolean_check(schema: Mapping) -> Checker:
+    """Checker for compile(errors='boolean')."""
+    plain = _unwrap_schema(schema)
+    if _generatable(plain):
+        # Generated without reason strings at all
+        return _checker(_generate_validator(plain, verbose=False))
+    verbose = _compiled_schema(schema).check
+    return lambda value: _OK if verbose(value)[0] else _FAILED
+
+
+def _checker(validate: Checker) -> Checker:
+    """Public-facing check around validate: unwraps ObjectTrees, memoizes scalars."""
+    # typed: 1, 1.0 and True are equal keys but validate differently
+    validate_scalar = lru_cache(maxsize=256, typed=True)(validate)
+
+    def check(value):
+        cls = value.__class__
+        if cls in _SCALARS and (cls is not str or len(value) <= _MEMO_MAX_LEN):
+            return validate_scalar(value)
+        if hasattr(value, 'to_dict'):
+            value = value.to_dict()
+        return validate(value)
+    check.validate_scalar = validate_scalar
+    return check
+
+
+class _CompiledSchema(NamedTuple):
+    """The keywords read outside the checker plan, resolved once per schema.
+
+    Sub-schemas are kept as found (ObjectTree nodes stay wrapped); absent
+    keywords are None, so callers test one attribute instead of probing
+    the schema mapping on every call.
+    """
+    validate: Checker
+    validate_scalar: Checker
+    check: Checker
+    type_: Any
+    properties: Mapping | None
+    items: Mapping | None
+    required: frozenset | None
+    additional: Any
+    contains: Mapping | None
+    all_of: list | None
+    one_of: list | None
+    any_of: list | None
+    if_: Mapping | None
+    then: Mapping | None
+    else_: Mapping | None
+    not_: Mapping | None
+
+
+_COMPILED = _IdCache()
+
+
+def _compiled_schema(schema: Mapping) -> _CompiledSchema:
+    """_CompiledSchema for a schema mapping, built once per schema object."""
+    cs = _COMPILED.get(schema)
+    if cs is None:
+        get = schema.get
+        props, items, contains = get('properties'), get('items'), get('contains')
+        req = get('required')
+
+        def branches(kw):
+            # The schema's own list object: branch caches key on its identity
+            subs = get(kw)
+            return subs if isinstance(subs, list) and subs else None
+
+        def sub(kw):
+            v = get(kw)
+            return v if isinstance(v, Mapping) else None
+
+        validate = _tiered(schema, partial(_run_plan, _compile_schema(schema)))
+        check = _checker(validate)
+        cs = _COMPILED.set(schema, _CompiledSchema(
+            validate=validate,
+            validate_scalar=check.validate_scalar,
+            check=check,
+            type_=get('type'),
+            properties=props if isinstance(props, Mapping) else None,
+            items=items if isinstance(items, Mapping) else None,
+            required=frozenset(_raw(req)) if isinstance(req, Sequence) and not isinstance(req, str) else None,
+            additional=get('additionalProperties'),
+            contains=contains if isinstance(contains, Mapping) else None,
+            all_of=branches('allOf'),
+            one_of=branches('oneOf'),
+            any_of=branches('anyOf'),
+            if_=sub('if'),
+            then=sub('then'),
+            else_=sub('else'),
+            not_=sub('not'),
+        ))
+    return cs
+
+
+# Values a schema validates through its checker plan before it gets
+# generated code: exec costs far more than a plan run, so a schema used
+# once or twice never pays it.
+_JIT_AFTER = 32
+
+
+def _tiered(schema: Mapping, run: Checker) -> Checker:
+    """run (the checker plan) until schema proves hot, then generated code."""
+    current = run
+    calls = 0
+
+    def validate(value):
+        nonlocal current, calls
+        if calls < _JIT_AFTER:
+            calls += 1
+            if calls == _JIT_AFTER:
+                current = _jit_validator(schema) or run
+        return current(value)
+    return validate
+
+
+def _validator_for(schema: Mapping) -> Checker:
+    """Compiled (ok, reason) validator for a schema, built once per schema object.
+
+    Runs the checker plan first; once the schema has validated _JIT_AFTER
+    values, schemas the generator covers switch to exec-generated code
+    (_jit_validator).
+    """
+    return _compiled_schema(schema).validate
+
+
+def _field_validator(field_schema: Any, field: str = '',
+                     parent: Mapping | None = None) -> Callable[[Any], None] | None:
+    """Type-binding check specialized for one property, or None if it has no constraints.
+
+    The compiled validator is resolved once here, so a write costs one call.
+    Local $refs in the property schema resolve against parent, the object
+    schema declaring the property. Raises the same TypeError as
+    SchemaAPI._validate_field.
+    """
+    if not isinstance(field_schema, Mapping):
+        return None
+    node = None
+    if parent is not None and any(
+            _is_local_ref(n.get('$ref')) for n in _schema_nodes(_unwrap_schema(field_schema))):
+        props = _resolved_plain(parent).get('properties')
+        node = props.get(field) if isinstance(props, dict) else None
+    if isinstance(node, dict):
+        plan = _compile_plain(node)
+        if not any(plan.values()):
+            return None
+        validate = _checker(partial(_run_plan, plan))
+    else:
+        if not any(_compile_schema(field_schema).values()):
+            return None
+        validate = _compiled_schema(field_schema).check
+    prefix = f"'{field}': " if field else ''
+
+    def check(value):
+        ok, reason = validate(value)
+        if not ok:
+            raise TypeError(f"{prefix}{reason}")
+    return check
+
+
+def _build_plan(schema: Mapping) -> Plan:
+    """Inspect schema once and return only the checkers it needs.
+
+    Constants are unwrapped and regexes compiled here, so checkers do no
+    schema lookups at validation time. Each checker is registered for the
+    value types it applies to (see _bucket_plan).
+    """
+    entries: list[tuple[Checker, tuple | None, Any]] = []
+
+    # --- $ref (already resolved to the target node by _resolve_refs) ---
+    ref = schema.get('$ref')
+    if isinstance(ref, dict):
+        target = None
+
+        def check_ref(value):
+            # The target plan is bound on first use, so building never
+            # follows $ref edges: no cycles, and long ref chains cost no
+            # recursion at compile time.
+            nonlocal target
+            if target is None:
+                target = _compile_plain(ref)
+            return _run_plan(target, value)
+        entries.append((check_ref, None, None))
 
     # --- type (supports string or array of strings) ---
     st = schema.get('type')
     if st is not None:
-        types = st if isinstance(st, (list, tuple)) else [st]
-        numeric_types = {'integer', 'number'}
-        if isinstance(value, bool) and 'boolean' not in types and (numeric_types & set(types)):
-            return False, f"expected type {st!r}, got bool"
-        allowed = []
-        for s in types:
-            mapped = _TYPE_MAP.get(s)
-            if mapped is not None:
-                if isinstance(mapped, tuple):
-                    allowed.extend(mapped)
-                else:
-                    allowed.append(mapped)
-        if allowed and not isinstance(value, tuple(allowed)):
-            return False, f"expected type {st!r}, got {type(value).__name__}"
+        spec = _type_spec(st)
+        allowed, reject_bool = _resolve_types(spec)
+        is_type = _type_predicate(spec)
+
+        def check_type(value):
+            if not is_type(value):
+                return False, f"expected type {st!r}, got {type(value).__name__}"
+            return _OK
+        # The outcome is fixed per bucket type: only register where it fails.
+        failing = tuple(
+            t for t in _BUCKET_TYPES
+            if (reject_bool and t is bool) or (allowed and not issubclass(t, allowed))
+        )
+        entries.append((check_type, failing, None))
 
     # --- const ---
     if 'const' in schema:
-        c = _raw(schema['const'])
-        if value != c:
-            return False, f"expected {c!r}, got {value!r}"
+        c = schema['const']
+
+        def check_const(value):
+            if value != c:
+                return False, f"expected {c!r}, got {value!r}"
+            return _OK
+        entries.append((check_const, None, None))
 
     # --- enum ---
     en = schema.get('enum')
     if isinstance(en, (list, tuple)):
-        raw_en = [_raw(e) for e in en]
-        if value not in raw_en:
-            return False, f"{value!r} not in {raw_en!r}"
+        raw_en = list(en)
+        in_enum = _member_test(raw_en)
+
+        def check_enum(value):
+            if not in_enum(value):
+                return False, f"{value!r} not in {raw_en!r}"
+            return _OK
+        entries.append((check_enum, None, None))
 
     # --- numeric: minimum / maximum / exclusive / multipleOf ---
-    if isinstance(value, (int, float)) and not isinstance(value, bool):
-        mn = schema.get('minimum')
-        if mn is not None and value < _raw(mn):
-            return False, f"{value} < minimum {_raw(mn)}"
-
-        mx = schema.get('maximum')
-        if mx is not None and value > _raw(mx):
-            return False, f"{value} > maximum {_raw(mx)}"
-
-        emn = schema.get('exclusiveMinimum')
-        if emn is not None and value <= _raw(emn):
-            return False, f"{value} <= exclusiveMinimum {_raw(emn)}"
-
-        emx = schema.get('exclusiveMaximum')
-        if emx is not None and value >= _raw(emx):
-            return False, f"{value} >= exclusiveMaximum {_raw(emx)}"
-
-        mo = schema.get('multipleOf')
-        if mo is not None:
-            raw_mo = _raw(mo)
-            if raw_mo != 0:
-                remainder = math.remainder(value, raw_mo)
-                if not math.isclose(remainder, 0, abs_tol=1e-9):
-                    return False, f"{value} is not a multiple of {raw_mo}"
+    mn = _keyword(schema, 'minimum')
+    mx = _keyword(schema, 'maximum')
+    emn = _keyword(schema, 'exclusiveMinimum')
+    emx = _keyword(schema, 'exclusiveMaximum')
+    mo = _keyword(schema, 'multipleOf')
+    if mo == 0:
+        mo = _UNSET
+    is_multiple = _multiple_checker(mo) if mo is not _UNSET else None
+    if not (mn is mx is emn is emx is mo is _UNSET):
+        def check_numeric(value):
+            if mn is not _UNSET and value < mn:
+                return False, f"{value} < minimum {mn}"
+            if mx is not _UNSET and value > mx:
+                return False, f"{value} > maximum {mx}"
+            if emn is not _UNSET and value <= emn:
+                return False, f"{value} <= exclusiveMinimum {emn}"
+            if emx is not _UNSET and value >= emx:
+                return False, f"{value} >= exclusiveMaximum {emx}"
+            if is_multiple is not None and not is_multiple(value):
+                return False, f"{value} is not a multiple of {mo}"
+            return _OK
+        entries.append((check_numeric, (int, float), (int, float)))
 
     # --- string: minLength / maxLength / pattern ---
-    if isinstance(value, str):
-        mnl = schema.get('minLength')
-        if mnl is not None and len(value) < _raw(mnl):
-            return False, f"length {len(value)} < minLength {_raw(mnl)}"
+    mnl = schema.get('minLength')
+    mxl = schema.get('maxLength')
+    pat = schema.get('pattern')
+    cpat = _compile_pattern(pat) if pat is not None else None
+    if (mnl, mxl, cpat) != (None,) * 3:
+        def check_string(value):
+            if mnl is not None and len(value) < mnl:
+                return False, f"length {len(value)} < minLength {mnl}"
+            if mxl is not None and len(value) > mxl:
+                return False, f"length {len(value)} > maxLength {mxl}"
+            if cpat is not None and not cpat.search(value):
+                return False, f"{value!r} does not match pattern {cpat.pattern!r}"
+            return _OK
+        entries.append((check_string, (str,), str))
+
+    # --- array: minItems / maxItems / uniqueItems ---
+    mni = schema.get('minItems')
+    mxi = schema.get('maxItems')
+    unique = bool(schema.get('uniqueItems'))
+    if (mni, mxi) != (None, None) or unique:
+        def check_array(value):
+            if mni is not None and len(value) < mni:
+                return False, f"array length {len(value)} < minItems {mni}"
+            if mxi is not None and len(value) > mxi:
+                return False, f"array length {len(value)} > maxItems {mxi}"
+            if unique:
+                dup = _find_duplicate(value)
+                if dup is not _NO_DUP:
+                    return False, f"duplicate item {dup!r} in array"
+            return _OK
+        entries.append((check_array, (list,), list))
 
-        mxl = schema.get('maxLength')
-        if mxl is not None and len(value) > _raw(mxl):
-            return False, f"length {len(value)} > maxLength {_raw(mxl)}"
+    # --- array: items / contains (element plans compiled once) ---
+    items = schema.get('items')
+    if isinstance(items, Mapping):
+        item_plan = _compile_plain(items)
+        if any(item_plan.values()):
+            all_numeric_ok = _numeric_items_check(items)
 
-        pat = schema.get('pattern')
-        if pat is not None:
-            raw_pat = _raw(pat)
-            if not re.search(raw_pat, value):
-                return False, f"{value!r} does not match pattern {raw_pat!r}"
+            def check_items(value):
+                if all_numeric_ok is not None and all_numeric_ok(value):
+                    return _OK
+                i = _first_failure(item_plan, value)
+                if i < 0:
+                    return _OK
+                return False, f"[{i}]: {_run_plan(item_plan, value[i])[1]}"
+            entries.append((check_items, (list,), list))
 
-    # --- array: minItems / maxItems / uniqueItems ---
-    if isinstance(value, list):
-        mni = schema.get('minItems')
-        if mni is not None and len(value) < _raw(mni):
-            return False, f"array length {len(value)} < minItems {_raw(mni)}"
-
-        mxi = schema.get('maxItems')
-        if mxi is not None and len(value) > _raw(mxi):
-            return False, f"array length {len(value)} > maxItems {_raw(mxi)}"
-
-        if schema.get('uniqueItems'):
-            seen = []
-            for item in value:
-                if item in seen:
-                    return False, f"duplicate item {item!r} in array"
-                seen.append(item)
+    contains = schema.get('contains')
+    if isinstance(contains, Mapping):
+        contains_plan = _compile_plain(contains)
+
+        def check_contains(value):
+            if _first_match(contains_plan, value) < 0:
+                return False, "no array item matches 'contains'"
+            return _OK
+        entries.append((check_contains, (list,), list))
 
     # --- object: required / properties / additionalProperties / min/maxProperties ---
-    if isinstance(value, Mapping):
-        req = schema.get('required')
-        if isinstance(req, (list, tuple)):
-            for r in req:
-                rk = _raw(r)
-                if rk not in value:
-                    return False, f"missing required field '{rk}'"
-
-        mnp = schema.get('minProperties')
-        if mnp is not None and len(value) < _raw(mnp):
-            return False, f"object has {len(value)} properties, minProperties is {_raw(mnp)}"
-
-        mxp = schema.get('maxProperties')
-        if mxp is not None and len(value) > _raw(mxp):
-            return False, f"object has {len(value)} properties, maxProperties is {_raw(mxp)}"
-
-        props = schema.get('properties')
-        if isinstance(props, Mapping):
-            for pk, ps in props.items():
-                if pk in value and isinstance(ps, Mapping):
-                    ok, reason = _check_value(ps, value[pk])
+    for check in _build_object_plan(schema):
+        entries.append((check, (dict,), Mapping))
+
+    # --- allOf: every sub-schema holds ---
+    subs = schema.get('allOf')
+    if isinstance(subs, list):
+        sub_plans = [_compile_plain(sub) for sub in subs if isinstance(sub, Mapping)]
+        sub_plans = [sub for sub in sub_plans if any(sub.values())]
+        if sub_plans:
+            def check_all_of(value):
+                for sub in sub_plans:
+                    ok, reason = _run_plan(sub, value)
                     if not ok:
-                        return False, f".{pk}: {reason}"
-
-        # patternProperties: regex keys -> sub-schema
-        pp = schema.get('patternProperties')
-        if isinstance(pp, Mapping):
-            for pat_key, pat_schema in pp.items():
-                raw_pat = _raw(pat_key)
-                if not isinstance(pat_schema, Mapping):
-                    continue
-                for vk, vv in value.items():
-                    if re.search(raw_pat, str(vk)):
-                        ok, reason = _check_value(pat_schema, vv)
+                        return False, reason
+                return _OK
+            entries.append((check_all_of, None, None))
+    return _bucket_plan(entries)
+
+
+_NUMERIC_KEYWORDS = frozenset({
+    'type', 'minimum', 'maximum', 'exclusiveMinimum', 'exclusiveMaximum', 'multipleOf',
+})
+
+
+def _numeric_items_check(items: Mapping) -> Callable[[list], bool] | None:
+    """Whole-array pass test for a purely numeric items schema, else None.
+
+    Checks element types with one set(map(type, ...)) and the bounds on
+    min()/max(), all in C; multipleOf maps its predicate over the list.
+    False means "not proven valid": the caller then runs the per-item plan,
+    which finds the failing index and message (and handles NaN/subclasses).
+    """
+    if not (_NUMERIC_KEYWORDS | _ANNOTATIONS).issuperset(items.keys()):
+        return None
+    st = items.get('type')
+    if st is None or st == 'number':
+        kinds = frozenset({int, float})
+    elif st == 'integer':
+        kinds = frozenset({int})
+    else:
+        return None
+    mn = _keyword(items, 'minimum')
+    mx = _keyword(items, 'maximum')
+    emn = _keyword(items, 'exclusiveMinimum')
+    emx = _keyword(items, 'exclusiveMaximum')
+    mo = _keyword(items, 'multipleOf')
+    is_multiple = _multiple_checker(mo) if mo is not _UNSET and mo != 0 else None
+
+    def all_ok(value):
+        if not value or not kinds.issuperset(map(type, value)):
+            return False
+        lo, hi = min(value), max(value)
+        if lo != lo or hi != hi:
+            return False
+        if mn is not _UNSET and lo < mn or emn is not _UNSET and lo <= emn:
+            return False
+        if mx is not _UNSET and hi > mx or emx is not _UNSET and hi >= emx:
+            return False
+        return is_multiple is None or all(map(is_multiple, value))
+    return all_ok
+
+
+def _first_failure(plan: Plan, items: Sequence) -> int:
+    """Index of the first item failing plan, or -1. One loop, no per-item call."""
+    get = plan.get
+    generic = plan[None]
+    for i, item in enumerate(items):
+        checks = get(type(item))
+        if checks is None:
+            checks = generic
+        for check in checks:
+            if not check(item)[0]:
+                return i
+    return -1
+
+
+def _first_match(plan: Plan, items: Sequence) -> int:
+    """Index of the first item passing plan, or -1."""
+    get = plan.get
+    generic = plan[None]
+    for i, item in enumerate(items):
+        checks = get(type(item))
+        if checks is None:
+            checks = generic
+        for check in checks:
+            if not check(item)[0]:
+                break
+        else:
+            return i
+    return -1
+
+
+_NO_DUP = object()
+
+
+def _find_duplicate(items: list) -> Any:
+    """Return the first repeated item, or _NO_DUP. O(n) via hashing."""
+    try:
+        # All-hashable (scalar) arrays: one C-level set build decides it
+        if len(set(items)) == len(items):
+            return _NO_DUP
+    except TypeError:
+        pass
+    seen = set()
+    try:
+        for item in items:
+            h = _hashable(item)
+            if h in seen:
+                return item
+            seen.add(h)
+    except TypeError:
+        # Exotic unhashable members: fall back to pairwise equality.
+        seen_list = []
+        for item in items:
+            if item in seen_list:
+                return item
+            seen_list.append(item)
+    return _NO_DUP
+
+
+# Backreferences (group numbers shift when joined) and inline flag groups
+# (before 3.11, a mid-pattern '(?i)' applies to every joined branch)
+_UNJOINABLE = re.compile(r'\\[1-9]|\(\?P=|\(\?[aiLmsux-]')
+
+
+def _any_pattern(patterns: list[str]) -> Callable[[str], Any] | None:
+    """search() of one regex matching where any of patterns matches, or None.
+
+    The patterns are joined as one alternation so a key costs one regex
+    call. Patterns with backreferences or inline flags, or that do not
+    compile together, fall back to testing each in turn.
+    """
+    if not patterns:
+        return None
+    if len(patterns) == 1:
+        return _compile_pattern(patterns[0]).search
+    if not any(_UNJOINABLE.search(p) for p in patterns):
+        try:
+            return re.compile('|'.join(f'(?:{p})' for p in patterns)).search
+        except re.error:
+            pass
+    compiled = [_compile_pattern(p) for p in patterns]
+    return lambda s: any(cre.search(s) for cre in compiled)
+
+
+def _build_object_plan(schema: Mapping) -> list[Checker]:
+    """Checkers for object keywords; callers only run them on mappings."""
+    plan: list[Checker] = []
+
+    req = schema.get('required')
+    if isinstance(req, (list, tuple)):
+        required = list(req)
+        required_set = frozenset(required)
+
+        def check_required(value):
+            if value.keys() >= required_set:
+                return _OK
+            missing = required_set - value.keys()
+            # Report the first missing key in declared order.
+            first = next(iter(missing)) if len(missing) == 1 else next(
+                rk for rk in required if rk in missing)
+            return False, f"missing required field '{first}'"
+        plan.append(check_required)
+
+    mnp = schema.get('minProperties')
+    mxp = schema.get('maxProperties')
+    if (mnp, mxp) != (None, None):
+        def check_size(value):
+            if mnp is not None and len(value) < mnp:
+                return False, f"object has {len(value)} properties, minProperties is {mnp}"
+            if mxp is not None and len(value) > mxp:
+                return False, f"object has {len(value)} properties, maxProperties is {mxp}"
+            return _OK
+        plan.append(check_size)
+
+    props = schema.get('properties')
+    if isinstance(props, Mapping):
+        # The error prefix of each path is joined here, once, not per failure.
+        # Leaf results for scalar values are memoized per leaf (bounded, typed
+        # so that 1, 1.0 and True stay distinct): leaf checks are pure. Long
+        # strings skip the memo, as in _checker.
+        flat = [(path, ''.join(f".{k}: " for k in path), sub,
+                 lru_cache(maxsize=256, typed=True)(partial(_run_plan, sub)))
+                for path, sub in _flatten_properties(props, ())]
+        if flat:
+            scalars, max_len = _SCALARS, _MEMO_MAX_LEN
+
+            def check_properties(value):
+                for path, prefix, sub, memo in flat:
+                    v = value
+                    for k in path:
+                        if not (type(v) is dict or isinstance(v, Mapping)) or k not in v:
+                            break
+                        v = v[k]
+                    else:
+                        cls = v.__class__
+                        if cls in scalars and (cls is not str or len(v) <= max_len):
+                            ok, reason = memo(v)
+                        else:
+                            ok, reason = _run_plan(sub, v)
                         if not ok:
-                            return False, f".{vk} (pattern '{raw_pat}'): {reason}"
-
-        # additionalProperties: False or schema
-        ap = schema.get('additionalProperties')
-        if ap is not None and ap is not True:
-            defined = set(props.keys()) if isinstance(props, Mapping) else set()
-            pp_patterns = [_raw(k) for k in pp.keys()] if isinstance(pp, Mapping) else []
-            extra = set()
-            for vk in value.keys():
-                if vk in defined:
-                    continue
-                if any(re.search(pat, str(vk)) for pat in pp_patterns):
-                    continue
-                extra.add(vk)
+                            return False, prefix + reason
+                return _OK
+            plan.append(check_properties)
+
+    # patternProperties: regex keys -> sub-schema
+    # additionalProperties: False or schema
+    pp = schema.get('patternProperties')
+    ap = schema.get('additionalProperties')
+    check_ap = ap is not None and ap is not True
+    defined = frozenset(props.keys()) if isinstance(props, Mapping) else frozenset()
+    ap_plan = _compile_plain(ap) if isinstance(ap, Mapping) else None
+
+    def check_extra(value, extra):
+        if ap is False:
+            return False, f"additional properties not allowed: {extra}"
+        if ap_plan is not None:
+            for ek in extra:
+                ok, reason = _run_plan(ap_plan, value[ek])
+                if not ok:
+                    return False, f".{ek} (additionalProperties): {reason}"
+        return _OK
+
+    if isinstance(pp, Mapping) and pp:
+        compiled_pp = [(_compile_pattern(k), v) for k, v in pp.items()]
+        pp_subs = [(cre, _compile_plain(ps)) for cre, ps in compiled_pp
+                   if isinstance(ps, Mapping)]
+        pp_any = _any_pattern([cre.pattern for cre, _ in compiled_pp])
+
+        # Per-key action table, resolved once per key name (names repeat
+        # across records): the pattern sub-plans the value must pass, and
+        # whether any pattern claims the key at all.
+        @lru_cache(maxsize=1024)
+        def actions(name):
+            if not pp_any(name):
+                return (), False
+            return tuple((i, cre.pattern, sub) for i, (cre, sub) in enumerate(pp_subs)
+                         if any(sub.values()) and cre.search(name)), True
+
+        # One walk over the instance serves both keywords. The reported
+        # pattern failure is the first in pattern-major order (declared
+        # pattern, then key order), as when each pattern scanned the keys:
+        # a failure of the first pattern ends the walk, later ones are kept
+        # until an earlier pattern fails.
+        def check_keys(value):
+            extra = None
+            failure = None
+            for vk, vv in value.items():
+                subs, matched = actions(str(vk))
+                for i, pattern, sub in subs:
+                    if failure is not None and i >= failure[0]:
+                        break
+                    ok, reason = _run_plan(sub, vv)
+                    if not ok:
+                        failure = (i, f".{vk} (pattern '{pattern}'): {reason}")
+                        break
+                if failure is not None and failure[0] == 0:
+                    break
+                if check_ap and not matched and vk not in defined:
+                    if extra is None:
+                        extra = set()
+                    extra.add(vk)
+            if failure is not None:
+                return False, failure[1]
             if extra:
-                if ap is False:
-                    return False, f"additional properties not allowed: {extra}"
-                if isinstance(ap, Mapping):
-                    for ek in extra:
-                        ok, reason = _check_value(ap, value[ek])
-                        if not ok:
-                            return False, f".{ek} (additionalProperties): {reason}"
+                return check_extra(value, extra)
+            return _OK
+        plan.append(check_keys)
+    elif check_ap:
+        def check_additional(value):
+            if value.keys() <= defined:
+                # Common case: no undeclared key, no set built
+                return _OK
+            return check_extra(value, value.keys() - defined)
+        plan.append(check_additional)
 
-        # dependencies (Draft-07): array form = required keys, schema form = sub-schema
-        # dependentRequired (2019-09): array form only (also supported)
-        for dep_kw in ('dependencies', 'dependentRequired'):
-            dr = schema.get(dep_kw)
-            if not isinstance(dr, Mapping):
-                continue
-            for dk, deps in dr.items():
-                raw_dk = _raw(dk)
-                if raw_dk not in value:
+    # dependencies (Draft-07): array form = required keys, schema form = sub-schema
+    # dependentRequired (2019-09): array form only (also supported)
+    dep_entries = []
+    for dep_kw in ('dependencies', 'dependentRequired'):
+        dr = schema.get(dep_kw)
+        if not isinstance(dr, Mapping):
+            continue
+        for dk, deps in dr.items():
+            if isinstance(deps, (list, tuple)):
+                dep_entries.append((dk, (list(deps), frozenset(deps)), None))
+            elif isinstance(deps, Mapping):
+                dep_entries.append((dk, None, _compile_plain(deps)))
+    if dep_entries:
+        # Reverse index on trigger keys: one set intersection per object,
+        # usually empty, instead of probing every declared dependency.
+        triggers = frozenset(dk for dk, _, _ in dep_entries)
+
+        def check_dependencies(value):
+            present = value.keys() & triggers
+            if not present:
+                return _OK
+            for dk, keys, sub in dep_entries:
+                if dk not in present:
                     continue
-                if isinstance(deps, (list, tuple)):
-                    for dep in deps:
-                        raw_dep = _raw(dep)
-                        if raw_dep not in value:
-                            return False, f"'{raw_dk}' requires '{raw_dep}' to be present"
-                elif isinstance(deps, Mapping):
-                    ok, reason = _check_value(deps, value)
+                if keys is not None:
+                    ordered, key_set = keys
+                    if value.keys() >= key_set:
+                        continue
+                    dep = next(k for k in ordered if k not in value)
+                    return False, f"'{dk}' requires '{dep}' to be present"
+                else:
+                    ok, reason = _run_plan(sub, value)
                     if not ok:
-                        return False, f"dependency '{raw_dk}': {reason}"
+                        return False, f"dependency '{dk}': {reason}"
+            return _OK
+        plan.append(check_dependencies)
+
+    return plan
+
+
+# Keywords with no validation effect; a schema made of these plus
+# 'properties' is a pure container that _flatten_properties can inline.
+_ANNOTATIONS = frozenset({
+    'title', 'description', 'default', 'examples', '$comment', '$id', '$schema',
+    'readOnly', 'writeOnly', 'format',
+})
+
+
+def _flatten_properties(props: Mapping, prefix: tuple) -> list[tuple[tuple, Plan]]:
+    """Flatten nested properties into (key path, leaf plan) entries.
+
+    Sub-schemas that only nest further properties are inlined, so a deep
+    payload is checked in one loop instead of one plan call per level.
+    Entries keep depth-first order, so the first reported error matches
+    the nested walk.
+    """
+    flat = []
+    for pk, ps in props.items():
+        if not isinstance(ps, Mapping):
+            continue
+        path = prefix + (pk,)
+        sub_props = ps.get('properties')
+        if isinstance(sub_props, Mapping) and _ANNOTATIONS.issuperset(ps.keys() - {'properties'}):
+            flat.extend(_flatten_properties(sub_props, path))
+            continue
+        sub = _compile_plain(ps)
+        if any(sub.values()):
+            flat.append((path, sub))
+    return flat
+
+
+_GUARDS = _IdCache()
+
+
+def _branch_guard(sub: Mapping) -> tuple:
+    """Cached (type predicate, const, required keys) trio for a branch schema."""
+    guard = _GUARDS.get(sub)
+    if guard is None:
+        st = sub.get('type')
+        types = None
+        if st is not None:
+            types = _type_predicate(_type_spec(st))
+        const = _raw(sub['const']) if 'const' in sub else _UNSET
+        req = sub.get('required')
+        required = frozenset(_raw(r) for r in req) if isinstance(req, (list, tuple)) else ()
+        guard = _GUARDS.set(sub, (types, const, required))
+    return guard
+
+
+def _can_branch_match(sub: Mapping, data: Any) -> bool:
+    """Cheap pre-check on type/const/required. False means sub cannot match."""
+    is_type, const, required = _branch_guard(sub)
+    if is_type is not None and not is_type(data):
+        return False
+    if const is not _UNSET and data != const:
+        return False
+    if required and isinstance(data, Mapping) and not data.keys() >= required:
+        return False
+    return True
+
+
+_DISCRIMINATORS = _IdCache()
+
+
+def _discriminator(subs: list | tuple) -> tuple[Any, dict] | None:
+    """Find a property every branch pins with const/enum.
+
+    Returns (key, {value: [branch indices]}) or None. Cached per subs list.
+    """
+    found = _DISCRIMINATORS.get(subs)
+    if found is None:
+        found = _DISCRIMINATORS.set(subs, _build_discriminator(subs) or ())
+    return found or None
+
+
+def _build_discriminator(subs: list | tuple) -> tuple[Any, dict] | None:
+    if len(subs) < 2 or not all(isinstance(sub, Mapping) for sub in subs):
+        return None
+    first = subs[0].get('properties')
+    if not isinstance(first, Mapping):
+        return None
+    for key in first.keys():
+        table: dict[Any, list[int]] = {}
+        try:
+            for i, sub in enumerate(subs):
+                props = sub.get('properties')
+                ps = props.get(key) if isinstance(props, Mapping) else None
+                if not isinstance(ps, Mapping):
+                    break
+                if 'const' in ps:
+                    values = [_raw(ps['const'])]
+                elif isinstance(ps.get('enum'), (list, tuple)):
+                    values = [_raw(e) for e in ps['enum']]
+                else:
+                    break
+                for v in values:
+                    branches = table.setdefault(v, [])
+                    # Repeated or Python-equal literals (['a', 'a'], [1, True])
+                    # must not list the branch twice
+                    if not branches or branches[-1] != i:
+                        branches.append(i)
+            else:
+                return key, table
+        except TypeError:
+            # Unhashable literal: this key cannot discriminate.
+            continue
+    return None
+
+
+# --- Leaf JIT: straight-line validators generated per schema ---
 
-    return True, ''
+# Keywords the generated code does not handle; schemas using any of them
+# go through the checker plan instead.
+_STRUCTURAL_KEYWORDS = frozenset({
+    '$ref', 'allOf', 'required', 'properties', 'patternProperties', 'additionalProperties',
+    'dependencies', 'dependentRequired', 'minProperties', 'maxProperties',
+    'minItems', 'maxItems', 'uniqueItems', 'items', 'contains',
+})
+
+_JITS = _IdCache()
+
+
+# Object keywords the generator emits inline, as long as every property
+# sub-schema is itself a leaf and no dependency is in schema form.
+_GENERATED_OBJECT_KEYWORDS = frozenset({
+    'required', 'properties', 'additionalProperties',
+    'dependencies', 'dependentRequired', 'minProperties', 'maxProperties',
+})
+
+
+def _generatable(schema: Mapping) -> bool:
+    """True if _validator_source covers every keyword of a plain schema."""
+    structural = _STRUCTURAL_KEYWORDS.intersection(schema.keys())
+    if not structural:
+        return True
+    if not structural <= _GENERATED_OBJECT_KEYWORDS:
+        return False
+    props = schema.get('properties')
+    if isinstance(props, Mapping):
+        for k, ps in props.items():
+            if type(k) is not str:
+                return False
+            if isinstance(ps, Mapping) and not _STRUCTURAL_KEYWORDS.isdisjoint(ps.keys()):
+                return False
+    ap = schema.get('additionalProperties')
+    if not (ap is None or ap is True or ap is False):
+        return False
+    for dep_kw in ('dependencies', 'dependentRequired'):
+        dr = schema.get(dep_kw)
+        if isinstance(dr, Mapping) and any(isinstance(d, Mapping) for d in dr.values()):
+            return False
+    return True
+
+
+def _jit_validator(schema: Mapping) -> Checker | None:
+    """Generated validator for a schema the generator covers, else None."""
+    fn = _JITS.get(schema)
+    if fn is None:
+        plain = _unwrap_schema(schema)
+        fn = _JITS.set(schema, _generate_validator(plain) if _generatable(plain) else False)
+    return fn or None
+
+
+def _generate_validator(schema: Mapping, verbose: bool = True) -> Checker:
+    """Emit and exec a function with the schema's constants baked in.
+
+    Produces the same (ok, reason) results as the checker plan; with
+    verbose=False every failure returns (False, None) instead.
+    """
+    source, ns = _validator_source(schema, verbose)
+    exec(builtins.compile(source, '<schema>', 'exec'), ns)
+    return ns['validate']
+
+
+# The failure statement ending each generated check line
+_FAIL_STATEMENT = re.compile(r'return False, .*$')
+
+
+def _validator_source(schema: Mapping, verbose: bool = True) -> tuple[str, dict[str, Any]]:
+    """Source of ``validate(x)`` for a plain schema, and the globals it needs."""
+    ns: dict[str, Any] = {'_OK': _OK, 'Mapping': Mapping}
+    lines = ['def validate(x):']
+
+    st = schema.get('type')
+    if st is not None:
+        allowed, reject_bool = _resolve_types(_type_spec(st))
+        ns['st'] = st
+        ns['allowed'] = allowed
+        if reject_bool:
+            lines.append("    if x.__class__ is bool: return False, f'expected type {st!r}, got bool'")
+        if allowed:
+            lines.append("    if not isinstance(x, allowed): "
+                         "return False, f'expected type {st!r}, got {type(x).__name__}'")
+
+    if 'const' in schema:
+        ns['c'] = schema['const']
+        lines.append("    if x != c: return False, f'expected {c!r}, got {x!r}'")
+
+    en = schema.get('enum')
+    if isinstance(en, (list, tuple)):
+        ns['en'] = list(en)
+        ns['in_enum'] = _member_test(ns['en'])
+        lines.append("    if not in_enum(x): return False, f'{x!r} not in {en!r}'")
+
+    numeric = []
+    for kw, op, cmp in (('minimum', 'x < mn', '<'), ('maximum', 'x > mx', '>'),
+                        ('exclusiveMinimum', 'x <= emn', '<='),
+                        ('exclusiveMaximum', 'x >= emx', '>=')):
+        bound = _keyword(schema, kw)
+        if bound is not _UNSET:
+            name = op.split()[-1]
+            ns[name] = bound
+            numeric.append(f"        if {op}: return False, f'{{x}} {cmp} {kw} {{{name}}}'")
+    mo = _keyword(schema, 'multipleOf')
+    if mo is not _UNSET and mo != 0:
+        ns['mo'] = mo
+        ns['is_multiple'] = _multiple_checker(mo)
+        numeric.append("        if not is_multiple(x): return False, f'{x} is not a multiple of {mo}'")
+    if numeric:
+        lines.append("    if x.__class__ is int or x.__class__ is float or ("
+                     "isinstance(x, (int, float)) and x.__class__ is not bool):")
+        lines.extend(numeric)
+
+    string = []
+    mnl = _keyword(schema, 'minLength')
+    if mnl is not _UNSET:
+        ns['mnl'] = mnl
+        string.append("        if len(x) < mnl: return False, f'length {len(x)} < minLength {mnl}'")
+    mxl = _keyword(schema, 'maxLength')
+    if mxl is not _UNSET:
+        ns['mxl'] = mxl
+        string.append("        if len(x) > mxl: return False, f'length {len(x)} > maxLength {mxl}'")
+    pat = schema.get('pattern')
+    if pat is not None:
+        ns['cpat'] = _compile_pattern(pat)
+        string.append("        if not cpat.search(x): "
+                      "return False, f'{x!r} does not match pattern {cpat.pattern!r}'")
+    if string:
+        lines.append("    if isinstance(x, str):")
+        lines.extend(string)
+
+    obj = []
+    req = schema.get('required')
+    if isinstance(req, (list, tuple)) and req:
+        ns['req'] = list(req)
+        ns['req_set'] = frozenset(req)
+        obj.append("        if not x.keys() >= req_set: "
+                   "return False, f\"missing required field '{next(k for k in req if k not in x)}'\"")
+    for kw, name, op in (('minProperties', 'mnp', '<'), ('maxProperties', 'mxp', '>')):
+        n = schema.get(kw)
+        if n is not None:
+            ns[name] = n
+            obj.append(f"        if len(x) {op} {name}: "
+                       f"return False, f'object has {{len(x)}} properties, {kw} is {{{name}}}'")
+    props = schema.get('properties')
+    if isinstance(props, Mapping):
+        for i, (pk, ps) in enumerate(props.items()):
+            if not isinstance(ps, Mapping) or not any(_compile_plain(ps).values()):
+                continue
+            ns[f'p{i}'] = _jit_validator(ps) if verbose else _generate_validator(ps, False)
+            obj.append(f"        if {pk!r} in x:")
+            obj.append(f"            r = p{i}(x[{pk!r}])")
+            obj.append(f"            if not r[0]: return False, {f'.{pk}: '!r} + r[1]")
+    if schema.get('additionalProperties') is False:
+        ns['defined'] = frozenset(props.keys()) if isinstance(props, Mapping) else frozenset()
+        obj.append("        if not x.keys() <= defined: "
+                   "return False, f'additional properties not allowed: {x.keys() - defined}'")
+    deps = [(dk, d) for dep_kw in ('dependencies', 'dependentRequired')
+            if isinstance(schema.get(dep_kw), Mapping)
+            for dk, d in schema[dep_kw].items() if isinstance(d, (list, tuple))]
+    for i, (dk, d) in enumerate(deps):
+        ns[f'dk{i}'] = dk
+        ns[f'd{i}'] = list(d)
+        ns[f'd{i}_set'] = frozenset(d)
+        obj.append(f"        if dk{i} in x and not x.keys() >= d{i}_set: "
+                   f"return False, f\"'{{dk{i}}}' requires "
+                   f"'{{next(k for k in d{i} if k not in x)}}' to be present\"")
+    if obj:
+        lines.append("    if x.__class__ is dict or isinstance(x, Mapping):")
+        lines.extend(obj)
+
+    if not verbose:
+        ns['_FAILED'] = _FAILED
+        lines = [_FAIL_STATEMENT.sub('return _FAILED', line) for line in lines]
+    lines.append("    return _OK")
+    return '\n'.join(lines) + '\n', ns
+
+
+def compile_to_source(schema: Mapping) -> str:
+    """Python source of the specialized validator generated for ``schema``.
+
+    The function ``validate(x)`` returns ``(ok, reason)`` exactly as the
+    checker plan would. Useful for inspecting what a schema compiles to.
+    Raises ValueError for schemas the generator does not cover (``items``,
+    ``patternProperties``, nested object schemas, schema-form dependencies...),
+    which are validated through the checker plan instead.
+    """
+    if not isinstance(schema, Mapping):
+        raise TypeError(f"schema must be a mapping, got {type(schema).__name__}")
+    plain = _unwrap_schema(schema)
+    if not _generatable(plain):
+        raise ValueError("schema uses keywords outside the generated validator")
+    return _validator_source(plain)[0]
+
+
+_MATCHES: dict[tuple[int, Any], tuple[Mapping, bool]] = {}
+_MATCHES_MAXSIZE = 4096
+
+
+def _freeze(v: Any) -> Any:
+    """Type-tagged hashable snapshot of data, used as a cache key.
+
+    Unlike _hashable, keeps 1, 1.0 and True apart so a cached result is
+    never reused across types. Raises TypeError for unhashable leaves.
+    """
+    v = _raw(v)
+    if isinstance(v, Mapping):
+        return dict, frozenset((k, _freeze(x)) for k, x in v.items())
+    if isinstance(v, list):
+        return list, tuple(_freeze(x) for x in v)
+    return v.__class__, v
 
 
 def _check_match(schema: Mapping, data: Any) -> bool:
-    """Check if data matches a sub-schema. Unwraps ObjectTree values."""
+    """Check if data matches a sub-schema. Unwraps ObjectTree values.
+
+    Results are memoized by (schema identity, data content), so repeated
+    branch resolution (project() then one_of()) validates only once.
+    """
     from .tree import ObjectTree
-    unwrapped = data.to_dict() if isinstance(data, ObjectTree) else data
-    ok, _ = _check_value(schema, unwrapped)
+    unwrapped = (data.to_dict() if data.__class__ is ObjectTree
+                 or isinstance(data, ObjectTree) else data)
+    try:
+        key = (id(schema), _freeze(unwrapped))
+    except TypeError:
+        key = None
+    if key is not None:
+        hit = _MATCHES.get(key)
+        if hit is not None and hit[0] is schema:
+            return hit[1]
+    ok = _validator_for(schema)(unwrapped)[0]
+    if key is not None:
+        if len(_MATCHES) >= _MATCHES_MAXSIZE:
+            _MATCHES.clear()
+        _MATCHES[key] = (schema, ok)
     return ok
 
 
+_MERGED = _IdCache()
+
+
+# Bounds that tighten under allOf: the largest lower / smallest upper bound wins.
+_TIGHTEST = {
+    'minimum': max, 'exclusiveMinimum': max, 'minLength': max,
+    'minItems': max, 'minProperties': max,
+    'maximum': min, 'exclusiveMaximum': min, 'maxLength': min,
+    'maxItems': min, 'maxProperties': min,
+}
+
+
+def _intersect_types(a: Any, b: Any) -> list:
+    """Type names allowed by both type keywords (integer is a number)."""
+    a = [a] if isinstance(a, str) else list(a)
+    b = [b] if isinstance(b, str) else list(b)
+    out = [t for t in a if t in b]
+    if 'number' in a and 'integer' in b or 'number' in b and 'integer' in a:
+        out.append('integer')
+    return list(dict.fromkeys(out))
+
+
+def _canonicalize(schema: Mapping) -> dict:
+    """Fold schema and its allOf sub-schemas into one plain schema.
+
+    Nested allOf are flattened depth-first (so a singleton allOf is just its
+    member), required is unioned in order, properties/items present in
+    several sources are merged recursively, type is intersected and numeric
+    / size bounds keep the tightest value. Annotations: later sources win.
+    Any other keyword that differs between sources, a type intersection that
+    comes out empty, and additionalProperties (which only makes sense next to
+    its own source's properties) stay behind in a residual allOf, so the
+    merged schema never accepts more than the original.
+    """
+    sources = []
+    stack = [_unwrap_schema(schema)]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+        sources.append(node)
+        subs = node.get('allOf')
+        if isinstance(subs, list):
+            stack.extend(reversed(subs))
+    merged: dict = {}
+    # Ordered set: one insertion per name, however many sources repeat it
+    required: dict = {}
+    residual: list = []
+    for src in sources:
+        for kw, v in src.items():
+            if kw == 'allOf':
+                continue
+            if kw == 'required' and isinstance(v, list):
+                required.update(dict.fromkeys(v))
+                merged[kw] = None  # placeholder, filled in below
+            elif kw == 'additionalProperties' and len(sources) > 1:
+                # Keep the property names it is relative to
+                rest = {kw: v}
+                for names in ('properties', 'patternProperties'):
+                    if isinstance(src.get(names), dict):
+                        rest[names] = dict.fromkeys(src[names], {})
+                residual.append(rest)
+            elif kw not in merged:
+                merged[kw] = dict(v) if kw == 'properties' and isinstance(v, dict) else v
+            elif kw == 'properties' and isinstance(v, dict):
+                props = merged[kw]
+                for pk, ps in v.items():
+                    prev = props.get(pk, True)
+                    if ps is True or ps == prev:
+                        continue  # adds no constraint
+                    if prev is True:
+                        props[pk] = ps
+                    elif isinstance(prev, dict) and isinstance(ps, dict):
+                        props[pk] = _canonicalize({'allOf': [prev, ps]})
+                    else:
+                        # e.g. false next to a schema: keep both checks
+                        residual.append({kw: {pk: ps}})
+            elif kw == 'items' and isinstance(v, dict) and isinstance(merged[kw], dict):
+                merged[kw] = _canonicalize({'allOf': [merged[kw], v]})
+            elif kw == 'type':
+                both = _intersect_types(merged[kw], v)
+                if both:
+                    merged[kw] = both
+                else:
+                    # No type satisfies every source: keep both checks
+                    residual.append({kw: v})
+            elif kw in _TIGHTEST:
+                merged[kw] = _TIGHTEST[kw](merged[kw], v)
+            elif kw in _ANNOTATIONS:
+                merged[kw] = v
+            elif merged[kw] != v:
+                residual.append({kw: v})
+    if 'required' in merged:
+        merged['required'] = list(required)
+    t = merged.get('type')
+    if isinstance(t, list) and len(t) == 1:
+        merged['type'] = t[0]
+    if residual:
+        merged['allOf'] = residual
+    return merged
+
+
+# Bumped by every ObjectTree mutation. Branch selections cached on a tree
+# are reused only while no tree has changed since they were computed.
+_epoch = 0
+
+
+def _mark_mutated() -> None:
+    global _epoch
+    _epoch += 1
+
+
+def _has_list(data: Any) -> bool:
+    """True if a to_dict() snapshot contains a list anywhere.
+
+    Plain lists can be changed in place without going through ObjectTree,
+    so selections over data containing them are never cached.
+    """
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            return True
+        if isinstance(node, dict):
+            stack.extend(node.values())
+    return False
+
+
 class SchemaAPI:
     """Draft-07 logic keywords as object methods (mixin for ObjectTree)."""
 
+    # No instance state of its own; keeps ObjectTree free of a __dict__
+    __slots__ = ()
+
     # --- Branch matching ---
 
-    def _match_branches(self, subs: list | tuple) -> list[int]:
-        """Return indices of sub-schemas that match current data."""
-        data = object.__getattribute__(self, '_data')
+    def _cached_matches(self, keyword: str, subs: Any, raw: Any = _UNSET) -> Any:
+        """Branch selection for keyword, reused while no tree has been mutated.
+
+        keyword 'if' caches the if-schema match (a bool); every other keyword
+        caches the matching branch indices of subs. raw is the to_dict()
+        snapshot, computed here only on a cache miss when not supplied.
+        """
+        cache = self._composition_cache
+        if cache is not None:
+            hit = cache.get(keyword)
+            if hit is not None and hit[0] == _epoch and hit[1] is subs:
+                return hit[2]
+        if raw is _UNSET:
+            raw = self.to_dict()
+        if keyword == 'if':
+            result = _check_match(subs, raw)
+        else:
+            result = self._match_branches(subs, raw)
+        if not _has_list(raw):
+            if cache is None:
+                cache = {}
+                object.__setattr__(self, '_composition_cache', cache)
+            cache[keyword] = (_epoch, subs, result)
+        return result
+
+    @staticmethod
+    def _match_branches(subs: list | tuple, data: Any) -> list[int]:
+        """Return indices of sub-schemas that match data (a to_dict() snapshot)."""
+        indices = range(len(subs))
+        disc = _discriminator(subs)
+        if disc is not None and isinstance(data, dict) and disc[0] in data:
+            key, table = disc
+            try:
+                indices = table.get(data[key], ())
+            except TypeError:
+                pass
         matches = []
-        for i, sub in enumerate(subs):
+        for i in indices:
+            sub = subs[i]
             if not isinstance(sub, Mapping):
                 continue
-            if _check_match(sub, data):
+            if _can_branch_match(sub, data) and _check_match(sub, data):
                 matches.append(i)
         return matches
 
@@ -253,16 +1664,17 @@ class SchemaAPI:
         Raises TypeError if zero or multiple branches match.
         """
         from .tree import ObjectTree
-        schema = object.__getattribute__(self, '_schema')
-        if not isinstance(schema, ObjectTree):
+        schema = self._schema
+        if schema.__class__ is not ObjectTree:
             return self
-        subs = schema.get('oneOf')
-        if not isinstance(subs, list) or not subs:
+        subs = _compiled_schema(schema).one_of
+        if subs is None:
             return self
-        matches = self._match_branches(subs)
+        raw = self.to_dict()
+        matches = self._cached_matches('oneOf', subs, raw)
         if len(matches) != 1:
             raise TypeError(f"oneOf: expected 1 match, got {len(matches)}")
-        return ObjectTree(self.to_dict(), schema=subs[matches[0]])
+        return ObjectTree(raw, schema=subs[matches[0]])
 
     def any_of(self) -> list['ObjectTree']:
         """anyOf (OR): return all matching branches.
@@ -270,50 +1682,38 @@ class SchemaAPI:
         Raises TypeError if no branches match.
         """
         from .tree import ObjectTree
-        schema = object.__getattribute__(self, '_schema')
-        if not isinstance(schema, ObjectTree):
+        schema = self._schema
+        if schema.__class__ is not ObjectTree:
             return [self]
-        subs = schema.get('anyOf')
-        if not isinstance(subs, list) or not subs:
+        subs = _compiled_schema(schema).any_of
+        if subs is None:
             return [self]
-        matches = self._match_branches(subs)
+        raw = self.to_dict()
+        matches = self._cached_matches('anyOf', subs, raw)
         if not matches:
             raise TypeError("anyOf: no matching branch")
-        return [ObjectTree(self.to_dict(), schema=subs[i]) for i in matches]
+        return [ObjectTree(raw, schema=subs[i]) for i in matches]
 
     def all_of(self) -> 'ObjectTree':
         """allOf (AND): merge all sub-schemas into one.
 
-        Merges properties, required, and items from top-level and allOf sub-schemas.
-        Later sub-schemas override earlier ones on key conflict.
+        The schema and its (nested) allOf are folded once by _canonicalize:
+        required is unioned, properties and items merged, type intersected
+        and bounds tightened. Annotations take the last value; any other
+        keyword that conflicts between sub-schemas stays in a residual allOf
+        on the merged schema, which validation still enforces.
         """
         from .tree import ObjectTree
-        schema = object.__getattribute__(self, '_schema')
-        if not isinstance(schema, ObjectTree):
+        schema = self._schema
+        if schema.__class__ is not ObjectTree:
             return self
-        subs = schema.get('allOf')
-        if not isinstance(subs, list) or not subs:
+        subs = _compiled_schema(schema).all_of
+        if subs is None:
             return self
 
-        merged = {}
-        sources = [schema] + [s for s in subs if isinstance(s, Mapping)]
-        for src in sources:
-            sp = src.get('properties') if isinstance(src, Mapping) else None
-            if isinstance(sp, Mapping):
-                merged.setdefault('properties', {})
-                for k, v in sp.items():
-                    merged['properties'][k] = _raw(v)
-            sr = src.get('required') if isinstance(src, Mapping) else None
-            if isinstance(sr, (list, tuple)):
-                merged.setdefault('required', [])
-                for r in sr:
-                    rv = _raw(r)
-                    if rv not in merged['required']:
-                        merged['required'].append(rv)
-            si = src.get('items') if isinstance(src, Mapping) else None
-            if isinstance(si, Mapping):
-                merged['items'] = _raw(si)
-
+        merged = _MERGED.get(schema)
+        if merged is None:
+            merged = _MERGED.set(schema, ObjectTree(_canonicalize(schema)))
         return ObjectTree(self.to_dict(), schema=merged)
 
     def not_of(self, schema: Mapping | None = None) -> bool:
@@ -321,14 +1721,13 @@ class SchemaAPI:
 
         Uses schema.not if no explicit schema provided.
         """
-        own_schema = object.__getattribute__(self, '_schema')
+        own_schema = self._schema
         target = schema
         if target is None and isinstance(own_schema, Mapping):
-            target = own_schema.get('not')
+            target = _compiled_schema(own_schema).not_
         if not isinstance(target, Mapping):
             return True
-        data = object.__getattribute__(self, '_data')
-        return not _check_match(target, data)
+        return not _check_match(target, self.to_dict())
 
     def if_then(self) -> 'ObjectTree':
         """if/then/else (CASE WHEN): conditional branch.
@@ -337,36 +1736,35 @@ class SchemaAPI:
         Returns self if no if-schema or no matching branch exists.
         """
         from .tree import ObjectTree
-        schema = object.__getattribute__(self, '_schema')
-        if not isinstance(schema, ObjectTree):
+        schema = self._schema
+        if schema.__class__ is not ObjectTree:
             return self
-        if_schema = schema.get('if')
-        if not isinstance(if_schema, Mapping):
+        cs = _compiled_schema(schema)
+        if cs.if_ is None:
             return self
-        data = object.__getattribute__(self, '_data')
-        if _check_match(if_schema, data):
-            branch = schema.get('then')
-        else:
-            branch = schema.get('else')
-        if isinstance(branch, Mapping):
-            return ObjectTree(self.to_dict(), schema=branch)
+        raw = self.to_dict()
+        branch = cs.then if self._cached_matches('if', cs.if_, raw) else cs.else_
+        if branch is not None:
+            return ObjectTree(raw, schema=branch)
         return self
 
     def project(self) -> 'ObjectTree':
         """properties (SELECT): keep only schema-defined fields.
 
+        Returns self when every field is already schema-defined.
         For oneOf/anyOf with exactly 1 match, auto-resolves.
         Raises TypeError on multiple matches — call one_of()/any_of() first.
         """
         from .tree import ObjectTree
-        schema = object.__getattribute__(self, '_schema')
-        if not isinstance(schema, ObjectTree):
+        schema = self._schema
+        if schema.__class__ is not ObjectTree:
             return self
+        data = self._data
         resolved = schema
-        for keyword in ('oneOf', 'anyOf'):
-            subs = schema.get(keyword)
-            if isinstance(subs, list) and subs:
-                matches = self._match_branches(subs)
+        cs = _compiled_schema(schema)
+        for keyword, subs in (('oneOf', cs.one_of), ('anyOf', cs.any_of)):
+            if subs is not None:
+                matches = self._cached_matches(keyword, subs)
                 if len(matches) == 1:
                     resolved = subs[matches[0]]
                 elif len(matches) > 1:
@@ -375,13 +1773,16 @@ class SchemaAPI:
                         f"use {keyword.replace('Of', '_of')}() first to disambiguate"
                     )
                 break
-        props = resolved.get('properties')
-        if not isinstance(props, Mapping):
+        props = _compiled_schema(resolved).properties
+        if props is None:
+            return self
+        if not isinstance(data, dict):
             return self
-        data = self.to_dict()
-        if not isinstance(data, Mapping):
+        if resolved is schema and data.keys() <= props.keys():
+            # Nothing to drop and no branch to switch to: already projected
             return self
-        filtered = {k: data[k] for k in props if k in data}
+        # Unwrap only the selected fields; dropped fields are never copied.
+        filtered = {k: self._unwrap(data[k]) for k in props if k in data}
         return ObjectTree(filtered, schema=resolved)
 
     def contains(self, schema: Mapping | None = None) -> bool:
@@ -389,19 +1790,15 @@ class SchemaAPI:
 
         Uses schema.contains if no explicit schema provided.
         """
-        own_schema = object.__getattribute__(self, '_schema')
+        own_schema = self._schema
         target = schema
         if target is None and isinstance(own_schema, Mapping):
-            target = own_schema.get('contains')
+            target = _compiled_schema(own_schema).contains
         if not isinstance(target, Mapping):
             return False
-        data = object.__getattribute__(self, '_data')
-        if not isinstance(data, list):
+        if not isinstance(self._data, list):
             return False
-        for item in data:
-            if _check_match(target, item):
-                return True
-        return False
+        return _first_match(_compile_schema(target), self.to_dict()) >= 0
 
     # --- Field validation (for type binding) ---
 
@@ -418,8 +1815,8 @@ class SchemaAPI:
         """
         if not isinstance(field_schema, Mapping):
             return
-        from .tree import ObjectTree
-        unwrapped = value.to_dict() if isinstance(value, ObjectTree) else value
+        from .tree import ObjectTree, ObjectTreeColumnar
+        unwrapped = value.to_dict() if isinstance(value, (ObjectTree, ObjectTreeColumnar)) else value
         ok, reason = _check_value(field_schema, unwrapped)
         if not ok:
             prefix = f"'{field}': " if field else ''
@@ -7,10 +7,78 @@ from __future__ import annotations
 
 import copy
 import json
+import operator
+import sys
 from collections.abc import Mapping, MutableMapping, Sequence
+from functools import lru_cache
+from itertools import chain
 from typing import Any, Dict, ItemsView, Iterator, KeysView, List, Union, ValuesView
 
-from .api import SchemaAPI
+from .api import (SchemaAPI, _compiled_schema, _field_validator, _IdCache, _mark_mutated,
+                  _prep_schema)
+
+# Exact-type aliases for hot-path dispatch: ``type(x) is _DICT`` is a pointer
+# compare, where ``isinstance(x, Mapping)`` walks the ABC machinery.
+_DICT = dict
+_LIST = list
+_STRINGS = (str, bytes, bytearray)
+# Concrete container types wrapped below the top level (subclasses included).
+# Other Mapping/Sequence implementations are only accepted by the constructor.
+_MAPPING_TYPES = (dict,)
+_SEQ_TYPES = (list, tuple)
+# JSON leaf types: returned unchanged by every wrap path
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+_NO_PROPS: dict = {}
+# properties dict -> {name: interned name}, shared by every node of a schema
+_NAMES = _IdCache()
+# sub-schema -> whether it declares a 'default' anywhere below it
+_DEEP_DEFAULTS = _IdCache()
+# caller's schema mapping -> its (prepped) schema ObjectTree
+_SCHEMA_TREES = _IdCache()
+# Per-schema state, kept off the nodes so data nodes carry no slots for it:
+# schema tree -> {property: unwrapped default}
+_DEFAULTS = _IdCache()
+# schema tree -> {property: check(value)}
+_VALIDATORS = _IdCache()
+
+
+def _schema_tree(schema: Mapping) -> 'ObjectTree':
+    """The schema ObjectTree for a schema, prepped once.
+
+    Keyed on the identity of the caller's mapping, so one module-level
+    schema dict maps to one tree and every per-schema cache keeps hitting.
+    """
+    if type(schema) is _OT:
+        _prep_schema(schema)
+        return schema
+    tree = _SCHEMA_TREES.get(schema)
+    if tree is None:
+        tree = _SCHEMA_TREES.set(schema, ObjectTree(schema))
+        _prep_schema(tree)
+    return tree
+
+
+@lru_cache(maxsize=256)
+def _path_getter(path: str) -> Any:
+    """attrgetter for a dotted path: one C-level getattr chain per call."""
+    return operator.attrgetter(path)
+
+
+def _fills_defaults(schema: Any) -> bool:
+    """True if wrapping data under schema may fill defaults at some depth."""
+    hit = _DEEP_DEFAULTS.get(schema)
+    if hit is None:
+        found = False
+        stack = [ObjectTree._unwrap(schema)]
+        while stack and not found:
+            node = stack.pop()
+            if type(node) is _DICT:
+                found = 'default' in node
+                stack.extend(node.values())
+            elif type(node) is _LIST:
+                stack.extend(node)
+        hit = _DEEP_DEFAULTS.set(schema, found)
+    return hit
 
 
 class ObjectTree(SchemaAPI, MutableMapping):
@@ -20,66 +88,155 @@ class ObjectTree(SchemaAPI, MutableMapping):
     JSON Schema logic   = method (method call gets correct value).
     """
 
-    __slots__ = ('_data', '_schema')
+    __slots__ = ('_data', '_schema', '_child_schema_cache', '_composition_cache')
 
     def __init__(self, data: Union[Mapping, Sequence, Any] = None, *, schema: Mapping | None = None, **kwargs):
         # schema -> ObjectTree (if not already)
-        if schema is not None and not isinstance(schema, ObjectTree):
-            schema = ObjectTree(schema)
+        if schema is not None:
+            schema = _schema_tree(schema)
         object.__setattr__(self, '_schema', schema)
+        object.__setattr__(self, '_child_schema_cache', None)
+        object.__setattr__(self, '_composition_cache', None)
 
         if data is None:
             data = kwargs if kwargs else {}
         elif kwargs:
             raise TypeError("Cannot pass both positional data and keyword arguments")
 
-        if isinstance(data, Mapping):
-            if schema:
-                data = self._apply_defaults(data, schema)
-
-            store = {}
-            for k, v in (data.items() if isinstance(data, Mapping) else dict(data).items()):
-                store[k] = self._wrap(k, v)
-            object.__setattr__(self, '_data', store)
-        elif isinstance(data, Sequence) and not isinstance(data, (str, bytes, bytearray)):
-            object.__setattr__(self, '_data', [self._wrap(None, item) for item in data])
+        t = type(data)
+        if t is _OT and (schema is None or schema is data._schema):
+            # Already wrapped: copy the top-level container, share the children
+            inner = data._data
+            if type(inner) is _LIST or type(inner) is _DICT and (
+                schema is None or inner.keys() >= self._defaults(schema).keys()
+            ):
+                # Raw children become shared ObjectTrees, as when already read
+                data._wrap_children(inner)
+                object.__setattr__(self, '_data', inner.copy())
+                if schema is not None:
+                    # Same schema: its child-schema map carries over
+                    object.__setattr__(self, '_child_schema_cache',
+                                       data._child_schema_cache)
+                return
+        # Exact types first; isinstance is the slow path for exotic user input
+        if t is _DICT or t is _OT or (t is not _LIST and isinstance(data, Mapping)):
+            if t is _OT:
+                data = data._data
+            object.__setattr__(self, '_data', self._build_store(data, schema))
+        elif t is _LIST or (isinstance(data, Sequence) and not isinstance(data, _STRINGS)):
+            # Dict items stay raw until indexed, like the children of a mapping,
+            # unless the items schema fills defaults (eager, for to_dict())
+            items = self._child_schemas()[1]
+            wrap_static, scalars = ObjectTree._wrap_static, _SCALAR_TYPES
+            lazy = items is None or not _fills_defaults(items)
+            object.__setattr__(self, '_data', [
+                item if type(item) in scalars
+                else _copy_containers(item) if lazy and type(item) is _DICT
+                else wrap_static(item, items)
+                for item in data
+            ])
         else:
             object.__setattr__(self, '_data', data)
 
     @staticmethod
-    def _apply_defaults(data: Mapping, schema: 'ObjectTree') -> dict | Mapping:
-        """Fill missing keys from schema.properties defaults."""
-        props = schema.get('properties')
-        if not isinstance(props, Mapping):
-            return data
-        defaults = {
-            p: ps['default']
-            for p, ps in props.items()
-            if isinstance(ps, Mapping) and 'default' in ps and p not in data
-        }
-        if not defaults:
-            return data
-        if isinstance(data, ObjectTree):
-            data = dict(data.to_dict())
-        elif not isinstance(data, dict):
-            data = dict(data)
-        data.update(defaults)
-        return data
+    def _defaults(schema: 'ObjectTree | None') -> dict:
+        """schema.properties defaults as {property: default}.
+
+        Computed once per schema and kept in _DEFAULTS; defaults are stored
+        unwrapped so every instance wraps its own copy.
+        """
+        if type(schema) is not _OT:
+            return _NO_PROPS
+        cache = _DEFAULTS.get(schema)
+        if cache is None:
+            cache = {}
+            sd = schema._data
+            props = sd.get('properties') if type(sd) is _DICT else None
+            if type(props) is _OT:
+                props = props._data
+            if type(props) is _DICT:
+                for p, ps in props.items():
+                    if type(ps) is _OT:
+                        ps = ps._data
+                    if type(ps) is _DICT and 'default' in ps:
+                        cache[p] = ObjectTree._unwrap(ps['default'])
+            _DEFAULTS.set(schema, cache)
+        return cache
 
     # --- Wrap/unwrap ---
 
+    def _build_store(self, data: Mapping, schema: 'ObjectTree | None') -> dict:
+        """Wrap every value of a mapping in one loop, with _wrap's dispatch inlined.
+
+        Plain dict children are stored as-is and only wrapped on first access
+        (see _child), so untouched subtrees never allocate ObjectTrees. Schema
+        defaults for missing keys go through the same loop, after the data.
+        """
+        props, _, names = self._child_schemas()
+        sub_get, canon = props.get, names.get
+        wrap, wrap_static = self._wrap, ObjectTree._wrap_static
+        _dict, _list, _ot, scalars = _DICT, _LIST, _OT, _SCALAR_TYPES
+        store = {}
+        entries = data.items()
+        defaults = self._defaults(schema)
+        if defaults:
+            missing = [(p, d) for p, d in defaults.items() if p not in data]
+            if missing:
+                entries = chain(entries, missing)
+        for k, v in entries:
+            if names:
+                # Reuse the schema's interned key object for known properties
+                k = canon(k, k)
+            t = type(v)
+            if t in scalars or t is _ot:
+                store[k] = v
+            elif type(k) is not str:
+                store[k] = wrap(k, v)
+            elif t is _dict:
+                sub = sub_get(k)
+                if sub is not None and _fills_defaults(sub):
+                    # Eager, so to_dict() shows nested defaults without access
+                    store[k] = _ot(v, schema=sub)
+                else:
+                    # Left raw (a private copy, so later edits to the caller's
+                    # dict do not leak in); wrapped by _child() on first access
+                    store[k] = _copy_containers(v)
+            elif t is _list:
+                # Copy in C, then only visit the items that need wrapping
+                v = store[k] = v[:]
+                items = _ABSENT
+                for i, item in enumerate(v):
+                    if type(item) not in scalars:
+                        if items is _ABSENT:
+                            sub = sub_get(k)
+                            items = sub.get('items') if type(sub) is _ot or type(sub) is _dict else None
+                        v[i] = wrap_static(item, items)
+            else:
+                store[k] = wrap(k, v)
+        return store
+
     def _wrap(self, key: str | int | None, value: Any) -> Any:
         """Wrap value, propagating sub-schema if available."""
-        if isinstance(value, ObjectTree):
+        t = type(value)
+        if t in _SCALAR_TYPES or t is _OT:
             return value
-        sub_schema = self._child_schema(key)
-        if isinstance(value, Mapping):
-            return ObjectTree(value, schema=sub_schema)
-        if isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray)):
+        if t is _DICT:
+            return ObjectTree(value, schema=self._child_schema(key))
+        if t is _LIST:
+            sub_schema = self._child_schema(key)
             items_schema = None
-            if isinstance(sub_schema, ObjectTree):
+            if type(sub_schema) is _OT or type(sub_schema) is _DICT:
                 items_schema = sub_schema.get('items')
-            elif isinstance(sub_schema, Mapping):
+            return [self._wrap_static(item, items_schema) for item in value]
+        if t is _COL:
+            return value
+        # dict/list subclasses and tuples
+        if isinstance(value, _MAPPING_TYPES):
+            return ObjectTree(value, schema=self._child_schema(key))
+        if isinstance(value, _SEQ_TYPES):
+            sub_schema = self._child_schema(key)
+            items_schema = None
+            if type(sub_schema) is _OT or type(sub_schema) is _DICT:
                 items_schema = sub_schema.get('items')
             return [self._wrap_static(item, items_schema) for item in value]
         return value
@@ -87,191 +244,330 @@ class ObjectTree(SchemaAPI, MutableMapping):
     @staticmethod
     def _wrap_static(value: Any, schema: Mapping | None = None) -> Any:
         """Wrap without parent context (for list items)."""
-        if isinstance(value, ObjectTree):
+        t = type(value)
+        if t in _SCALAR_TYPES or t is _OT or t is _COL:
             return value
-        if isinstance(value, Mapping):
+        if t is _DICT or (t is not _LIST and isinstance(value, _MAPPING_TYPES)):
             return ObjectTree(value, schema=schema)
-        if isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray)):
+        if t is _LIST or isinstance(value, _SEQ_TYPES):
             items_schema = None
-            if isinstance(schema, Mapping):
+            if type(schema) is _OT or type(schema) is _DICT:
                 items_schema = schema.get('items')
             return [ObjectTree._wrap_static(item, items_schema) for item in value]
         return value
 
+    def _child(self, data: dict | list, key: Any) -> Any:
+        """data[key], wrapping a still-raw dict child in place on first access."""
+        v = data[key]
+        if type(v) is _DICT:
+            v = data[key] = ObjectTree(v, schema=self._child_schema(key))
+        return v
+
+    def _wrap_children(self, data: dict | list) -> None:
+        """Wrap every still-raw dict child of a store in place."""
+        for k, v in (data.items() if type(data) is _DICT else enumerate(data)):
+            if type(v) is _DICT:
+                data[k] = ObjectTree(v, schema=self._child_schema(k))
+
+    def _child_schemas(self) -> tuple:
+        """(properties map, items schema, interned names) of this node's schema.
+
+        Memoized on the node; the interned-name table is shared per schema.
+        """
+        cache = self._child_schema_cache
+        if cache is not None:
+            return cache
+        props, items = _NO_PROPS, None
+        schema = self._schema
+        sd = schema._data if type(schema) is _OT else None
+        if type(sd) is _DICT:
+            # Wrap the sub-schemas once so every child node sees the same objects
+            p = schema._child(sd, 'properties') if 'properties' in sd else None
+            if type(p) is _OT:
+                p = p._data
+                if type(p) is _DICT:
+                    schema._wrap_children(p)
+                    props = p
+            i = schema._child(sd, 'items') if 'items' in sd else None
+            if type(i) is _OT:
+                items = i
+        names = _NO_PROPS
+        if props:
+            names = _NAMES.get(props)
+            if names is None:
+                names = _NAMES.set(props, {k: sys.intern(k) for k in props if type(k) is str})
+        cache = (props, items, names)
+        object.__setattr__(self, '_child_schema_cache', cache)
+        return cache
+
     def _child_schema(self, key: str | int | None) -> Mapping | None:
         """Get sub-schema for a child key via schema attributes."""
-        schema = object.__getattribute__(self, '_schema')
-        if not isinstance(schema, ObjectTree):
-            return None
-        if isinstance(key, str):
-            props = schema.get('properties')
-            if isinstance(props, Mapping) and key in props:
-                return props[key]
-        elif isinstance(key, int) or key is None:
-            items = schema.get('items')
-            if isinstance(items, Mapping):
-                return items
+        if type(key) is str:
+            return self._child_schemas()[0].get(key)
+        if key is None or isinstance(key, int):
+            return self._child_schemas()[1]
         return None
 
     @staticmethod
     def _unwrap(value: Any) -> Any:
-        if isinstance(value, ObjectTree):
+        """Convert to plain dict/list with an explicit stack (no recursion limit)."""
+        t = type(value)
+        if t is _OT:
+            value = value._data
+            t = type(value)
+        elif t is _COL:
             return value.to_dict()
-        if isinstance(value, dict):
-            return {k: ObjectTree._unwrap(v) for k, v in value.items()}
-        if isinstance(value, list):
-            return [ObjectTree._unwrap(item) for item in value]
-        return value
+        elif t is not _DICT and t is not _LIST:
+            if isinstance(value, _OT):
+                value = value._data
+                t = type(value)
+            elif isinstance(value, _COL):
+                return value.to_dict()
+        if t is _DICT:
+            root = {}
+        elif t is _LIST:
+            root = [None] * len(value)
+        else:
+            return value
+        stack = [(value, root)]
+        pop, push = stack.pop, stack.append
+        while stack:
+            src, dst = pop()
+            for k, v in (src.items() if type(src) is _DICT else enumerate(src)):
+                t = type(v)
+                if t is _OT:
+                    v = v._data
+                    t = type(v)
+                elif t is _COL:
+                    v = v.to_dict()
+                    t = None
+                elif t not in _SCALAR_TYPES and t is not _DICT and t is not _LIST:
+                    # Subclasses miss the exact-type fast path above.
+                    if isinstance(v, _OT):
+                        v = v._data
+                        t = type(v)
+                    elif isinstance(v, _COL):
+                        v = v.to_dict()
+                        t = None
+                if t is _DICT:
+                    out = {}
+                    push((v, out))
+                    v = out
+                elif t is _LIST:
+                    out = [None] * len(v)
+                    push((v, out))
+                    v = out
+                dst[k] = v
+        return root
 
     # --- Attribute access ---
 
     def __getattr__(self, key: str) -> Any:
-        if key.startswith('_'):
+        if key[:1] == '_':
             return object.__getattribute__(self, key)
-        data = object.__getattribute__(self, '_data')
-        if isinstance(data, dict) and key in data:
-            return data[key]
-        raise AttributeError(f"'{type(self).__name__}' has no attribute '{key}'")
+        data = self._data
+        v = data.get(key, _MISSING) if type(data) is _DICT else _MISSING
+        if v is _MISSING:
+            raise AttributeError(f"'{type(self).__name__}' has no attribute '{key}'")
+        if type(v) is _DICT:
+            v = data[key] = ObjectTree(v, schema=self._child_schema(key))
+        return v
 
     def __setattr__(self, key: str, value: Any) -> None:
         if key.startswith('_'):
             object.__setattr__(self, key, value)
+            if key == '_schema':
+                object.__setattr__(self, '_child_schema_cache', None)
             return
-        data = object.__getattribute__(self, '_data')
-        if not isinstance(data, dict):
+        data = self._data
+        if type(data) is not _DICT:
             raise TypeError("Cannot set attribute on non-mapping ObjectTree")
         wrapped = self._wrap(key, value)
         self._bind_type_check(key, wrapped)
         data[key] = wrapped
+        _mark_mutated()
 
     def __delattr__(self, key: str) -> None:
         if key.startswith('_'):
             object.__delattr__(self, key)
             return
-        data = object.__getattribute__(self, '_data')
-        if not isinstance(data, dict):
+        data = self._data
+        if type(data) is not _DICT:
             raise TypeError("Cannot delete attribute on non-mapping ObjectTree")
         if key not in data:
             raise AttributeError(f"'{type(self).__name__}' has no attribute '{key}'")
         del data[key]
+        _mark_mutated()
 
     # --- Mapping protocol ---
 
     def __getitem__(self, key: Union[str, int]) -> Any:
-        data = object.__getattribute__(self, '_data')
-        if isinstance(data, dict):
-            return data[key]
-        if isinstance(data, list):
-            return data[key]
+        data = self._data
+        if type(data) is _DICT:
+            return self._child(data, key)
+        if type(data) is _LIST:
+            if type(key) is slice:
+                self._wrap_children(data)
+                return data[key]
+            return self._child(data, key)
         raise TypeError(f"'{type(self).__name__}' is not subscriptable")
 
     def __setitem__(self, key: Union[str, int], value: Any) -> None:
-        data = object.__getattribute__(self, '_data')
-        if isinstance(data, (dict, list)):
+        data = self._data
+        if (type(data) is _DICT or type(data) is _LIST):
             wrapped = self._wrap(key, value)
             self._bind_item_type_check(key, wrapped)
             data[key] = wrapped
+            _mark_mutated()
             return
         raise TypeError(f"'{type(self).__name__}' does not support item assignment")
 
     def __delitem__(self, key: Union[str, int]) -> None:
-        data = object.__getattribute__(self, '_data')
-        if isinstance(data, (dict, list)):
+        data = self._data
+        if (type(data) is _DICT or type(data) is _LIST):
             del data[key]
+            _mark_mutated()
             return
         raise TypeError(f"'{type(self).__name__}' does not support item deletion")
 
     def __iter__(self) -> Iterator:
-        data = object.__getattribute__(self, '_data')
-        if isinstance(data, dict):
+        data = self._data
+        if type(data) is _DICT:
             return iter(data)
         raise TypeError("ObjectTree is not iterable as a mapping when wrapping a sequence/scalar")
 
     def __len__(self) -> int:
-        data = object.__getattribute__(self, '_data')
-        if isinstance(data, dict):
+        data = self._data
+        if type(data) is _DICT:
             return len(data)
         raise TypeError("ObjectTree has no mapping length when wrapping a sequence/scalar")
 
     def __contains__(self, key) -> bool:
-        data = object.__getattribute__(self, '_data')
-        if isinstance(data, dict):
-            return key in data
-        return False
+        data = self._data
+        return type(data) is _DICT and data.__contains__(key)
+
+    def __reversed__(self) -> Iterator:
+        data = self._data
+        if type(data) is _DICT:
+            return reversed(data)
+        raise TypeError("ObjectTree is not iterable as a mapping when wrapping a sequence/scalar")
 
     # --- Convenience ---
 
     def get(self, key: str, default: Any = None) -> Any:
-        data = object.__getattribute__(self, '_data')
-        if isinstance(data, dict):
-            return data.get(key, default)
+        data = self._data
+        if type(data) is _DICT:
+            return self._child(data, key) if key in data else default
         return default
 
     def pop(self, key: str, *args) -> Any:
-        data = object.__getattribute__(self, '_data')
-        if not isinstance(data, dict):
+        data = self._data
+        if type(data) is not _DICT:
             raise TypeError("pop() requires mapping ObjectTree")
+        if key in data:
+            self._child(data, key)
+            _mark_mutated()
         return data.pop(key, *args)
 
+    def popitem(self) -> tuple:
+        # Same order as MutableMapping.popitem (first key), without the
+        # __iter__/__getitem__/__delitem__ round-trip
+        data = self._data
+        if type(data) is not _DICT:
+            raise TypeError("popitem() requires mapping ObjectTree")
+        for key in data:
+            self._child(data, key)
+            _mark_mutated()
+            return key, data.pop(key)
+        raise KeyError('popitem(): ObjectTree is empty')
+
     def clear(self) -> None:
-        data = object.__getattribute__(self, '_data')
-        if not isinstance(data, dict):
+        data = self._data
+        if type(data) is not _DICT:
             raise TypeError("clear() requires mapping ObjectTree")
         data.clear()
+        _mark_mutated()
 
     def copy(self) -> 'ObjectTree':
-        """Shallow copy."""
-        return ObjectTree(self.to_dict(), schema=object.__getattribute__(self, '_schema'))
+        """Shallow copy: new top-level container, children shared by reference.
+
+        Also serves copy.copy() directly (__copy__), keeping the subclass.
+        """
+        data = self._data
+        cls = self.__class__
+        new = cls.__new__(cls)
+        if type(data) is _DICT or type(data) is _LIST:
+            # Raw children become shared ObjectTrees, as when already read
+            self._wrap_children(data)
+            data = data.copy()
+        object.__setattr__(new, '_data', data)
+        object.__setattr__(new, '_schema', self._schema)
+        object.__setattr__(new, '_child_schema_cache', self._child_schema_cache)
+        object.__setattr__(new, '_composition_cache', None)
+        return new
 
     def setdefault(self, key: str, default: Any = None) -> Any:
-        data = object.__getattribute__(self, '_data')
-        if not isinstance(data, dict):
+        data = self._data
+        if type(data) is not _DICT:
             raise TypeError("setdefault() requires mapping ObjectTree")
         if key in data:
-            return data[key]
+            return self._child(data, key)
         wrapped = self._wrap(key, default)
         self._bind_type_check(key, wrapped)
         data[key] = wrapped
-        return data[key]
+        _mark_mutated()
+        return wrapped
 
     def update(self, other: Union[Mapping, 'ObjectTree'] = None, **kwargs) -> None:
-        data = object.__getattribute__(self, '_data')
-        if not isinstance(data, dict):
+        data = self._data
+        if type(data) is not _DICT:
             raise TypeError("Cannot update non-mapping ObjectTree")
-        if other is not None:
-            if isinstance(other, ObjectTree):
-                other = other.to_dict()
-            for k, v in dict(other).items():
-                wrapped = self._wrap(k, v)
-                self._bind_type_check(k, wrapped)
-                data[k] = wrapped
-        for k, v in kwargs.items():
-            wrapped = self._wrap(k, v)
-            self._bind_type_check(k, wrapped)
-            data[k] = wrapped
+        # Wrap and validate every incoming value first, then apply them in one
+        # dict.update: a failing key leaves the tree untouched.
+        staged = {}
+        wrap, validators = self._wrap, self._field_validators()
+        for source in (other, kwargs):
+            if not source:
+                continue
+            t = type(source)
+            if t is _OT or isinstance(source, _OT):
+                # Plain copy, so no child is shared with the other tree
+                source = ObjectTree._unwrap(source)
+            elif t is not _DICT and not isinstance(source, Mapping):
+                source = dict(source)
+            for k, v in source.items():
+                wrapped = staged[k] = wrap(k, v)
+                fn = validators.get(k) if validators else None
+                if fn is not None:
+                    fn(wrapped)
+        if staged:
+            data.update(staged)
+            _mark_mutated()
 
     def keys(self) -> KeysView[str]:
-        data = object.__getattribute__(self, '_data')
-        if isinstance(data, dict):
+        data = self._data
+        if type(data) is _DICT:
             return data.keys()
         return {}.keys()
 
     def values(self) -> ValuesView[Any]:
-        data = object.__getattribute__(self, '_data')
-        if isinstance(data, dict):
+        data = self._data
+        if type(data) is _DICT:
+            self._wrap_children(data)
             return data.values()
         return {}.values()
 
     def items(self) -> ItemsView[str, Any]:
-        data = object.__getattribute__(self, '_data')
-        if isinstance(data, dict):
+        data = self._data
+        if type(data) is _DICT:
+            self._wrap_children(data)
             return data.items()
         return {}.items()
 
     # --- Conversion ---
 
     def to_dict(self) -> Union[Dict, List, Any]:
-        data = object.__getattribute__(self, '_data')
+        data = self._data
         return self._unwrap(data)
 
     def to_native(self) -> Union[Dict, List, Any]:
@@ -281,13 +577,13 @@ class ObjectTree(SchemaAPI, MutableMapping):
 
     @property
     def is_mapping(self) -> bool:
-        data = object.__getattribute__(self, '_data')
-        return isinstance(data, dict)
+        data = self._data
+        return type(data) is _DICT
 
     @property
     def is_sequence(self) -> bool:
-        data = object.__getattribute__(self, '_data')
-        return isinstance(data, list)
+        data = self._data
+        return type(data) is _LIST
 
     # --- Constructors ---
 
@@ -304,90 +600,394 @@ class ObjectTree(SchemaAPI, MutableMapping):
     # --- Python protocols ---
 
     def __repr__(self) -> str:
-        data = object.__getattribute__(self, '_data')
+        data = self._data
         return f"ObjectTree({self._unwrap(data)!r})"
 
     def __str__(self) -> str:
         return str(self.to_dict())
 
     def __eq__(self, other) -> bool:
-        if isinstance(other, ObjectTree):
-            return self.to_dict() == other.to_dict()
+        if type(other) is _OT or isinstance(other, ObjectTree):
+            return self._equal(self._data, other._data)
         if isinstance(other, Mapping):
-            return self.to_dict() == dict(other)
+            return self._equal(self._data, dict(other))
         return NotImplemented
 
+    @staticmethod
+    def _equal(a: Any, b: Any) -> bool:
+        """a == b on the unwrapped values, walked in place with an explicit stack.
+
+        Same result as comparing to_dict() outputs, without building them and
+        stopping at the first difference.
+        """
+        stack = [(a, b)]
+        pop, push = stack.pop, stack.append
+        while stack:
+            a, b = pop()
+            if type(a) is _OT:
+                a = a._data
+            if type(b) is _OT:
+                b = b._data
+            if a is b:
+                continue
+            ta, tb = type(a), type(b)
+            if ta is _DICT and tb is _DICT:
+                if len(a) != len(b):
+                    return False
+                for k, v in a.items():
+                    w = b.get(k, _MISSING)
+                    if w is _MISSING:
+                        return False
+                    push((v, w))
+            elif ta is _LIST and tb is _LIST:
+                if len(a) != len(b):
+                    return False
+                stack.extend(zip(a, b))
+            elif ta in _SCALAR_TYPES and tb in _SCALAR_TYPES:
+                if a != b:
+                    return False
+            elif ObjectTree._unwrap(a) != ObjectTree._unwrap(b):
+                return False
+        return True
+
     def __bool__(self) -> bool:
-        data = object.__getattribute__(self, '_data')
-        if isinstance(data, (dict, list)):
+        data = self._data
+        if (type(data) is _DICT or type(data) is _LIST):
             return bool(data)
         return data is not None
 
-    def __copy__(self) -> 'ObjectTree':
-        return self.copy()
+    __copy__ = copy
 
     def __deepcopy__(self, memo) -> 'ObjectTree':
-        schema = object.__getattribute__(self, '_schema')
-        return ObjectTree(
-            copy.deepcopy(self.to_dict(), memo),
-            schema=copy.deepcopy(schema, memo) if schema else None,
-        )
-
-    def __getstate__(self) -> dict:
-        schema = object.__getattribute__(self, '_schema')
-        return {
-            'data': self.to_dict(),
-            'schema': schema.to_dict() if isinstance(schema, ObjectTree) else schema,
-        }
+        # The schema is shared by reference: schemas are immutable by convention.
+        # Children are left raw and wrapped on access, as in __init__.
+        result = ObjectTree(_fast_deepcopy(self._data, memo), schema=self._schema)
+        memo[id(self)] = result
+        return result
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        """Pickle as a constructor call on plain data, not slot by slot.
+
+        The payload is pickled by the C pickler's dict/list fast paths; a
+        schema shared by several trees is stored once. Prefer
+        pickle.dumps(o, protocol=pickle.HIGHEST_PROTOCOL).
+        """
+        return _restore, (self.__class__, self.to_dict(), self._schema)
 
     def __setstate__(self, state: dict) -> None:
+        """Load pickles written by earlier releases ({'data', 'schema'} state)."""
         self.__init__(state['data'], schema=state.get('schema'))
 
     def __or__(self, other) -> 'ObjectTree':
-        if isinstance(other, ObjectTree):
-            other = other.to_dict()
-        if not isinstance(other, Mapping):
+        if type(other) is not _OT and not isinstance(other, Mapping):
+            return NotImplemented
+        # Built from plain copies of both sides: the result never shares a
+        # child with either operand, whichever children were read before
+        merged = self._unwrap(self)
+        if type(merged) is not _DICT:
             return NotImplemented
-        merged = {**self.to_dict(), **dict(other)}
-        return ObjectTree(merged, schema=object.__getattribute__(self, '_schema'))
+        merged.update(self._unwrap(other) if isinstance(other, _OT) else other)
+        return ObjectTree(merged, schema=self._schema)
 
     def __ior__(self, other) -> 'ObjectTree':
-        if isinstance(other, ObjectTree):
-            other = other.to_dict()
-        if not isinstance(other, Mapping):
+        if type(other) is not _OT and not isinstance(other, Mapping):
             return NotImplemented
         self.update(other)
         return self
 
     # --- Type binding ---
 
+    def _field_validators(self) -> dict:
+        """{property: check(value)} for this node's schema, built once per schema."""
+        schema = self._schema
+        if type(schema) is not _OT:
+            return _NO_PROPS
+        validators = _VALIDATORS.get(schema)
+        if validators is None:
+            validators = {}
+            for k, ps in self._child_schemas()[0].items():
+                fn = _field_validator(ps, k, schema)
+                if fn is not None:
+                    validators[k] = fn
+            _VALIDATORS.set(schema, validators)
+        return validators
+
     def _bind_type_check(self, key: str, value: Any) -> None:
-        schema = object.__getattribute__(self, '_schema')
-        if not isinstance(schema, ObjectTree):
-            return
-        props = schema.get('properties')
-        if isinstance(props, Mapping) and key in props:
-            self._validate_field(props[key], value, field=key)
+        fn = self._field_validators().get(key)
+        if fn is not None:
+            fn(value)
 
     def _bind_item_type_check(self, key: Union[str, int], value: Any) -> None:
-        schema = object.__getattribute__(self, '_schema')
-        if not isinstance(schema, ObjectTree):
-            return
-        data = object.__getattribute__(self, '_data')
-        if isinstance(data, dict) and isinstance(key, str):
-            props = schema.get('properties')
-            if isinstance(props, Mapping) and key in props:
-                self._validate_field(props[key], value, field=key)
-        elif isinstance(data, list):
-            items = schema.get('items')
+        data = self._data
+        if type(data) is _DICT and type(key) is str:
+            fn = self._field_validators().get(key)
+            if fn is not None:
+                fn(value)
+        elif type(data) is _LIST:
+            schema = self._schema
+            items = _compiled_schema(schema).items if type(schema) is _OT else None
             if items:
                 self._validate_field(items, value, field=f'[{key}]')
 
 
+_OT = ObjectTree
+
+
+def _copy_containers(value: dict) -> dict:
+    """Copy of a plain dict with every nested dict and list rebuilt.
+
+    Other values are shared, as wrapping would share them. Keeps lazily
+    stored children independent of the caller's input.
+    """
+    root = {}
+    stack = [(value, root)]
+    pop, push = stack.pop, stack.append
+    while stack:
+        src, dst = pop()
+        for k, v in (src.items() if type(src) is _DICT else enumerate(src)):
+            t = type(v)
+            if t is _DICT:
+                out = {}
+                push((v, out))
+            elif t is _LIST:
+                out = [None] * len(v)
+                push((v, out))
+            else:
+                out = v
+            dst[k] = out
+    return root
+
+
+def _fast_deepcopy(value: Any, memo: dict) -> Any:
+    """Deep copy of plain data in one stack walk, unwrapping ObjectTree nodes.
+
+    dict/list are rebuilt and scalars shared directly; tuples and frozensets of
+    scalars are immutable and shared too. Anything else goes to copy.deepcopy.
+    """
+    scalars, deepcopy = _SCALAR_TYPES, copy.deepcopy
+    t = type(value)
+    if t is _OT:
+        value = value._data
+        t = type(value)
+    if t is _DICT:
+        root = {}
+    elif t is _LIST:
+        root = [None] * len(value)
+    elif t in scalars:
+        return value
+    else:
+        return deepcopy(ObjectTree._unwrap(value), memo)
+    stack = [(value, root)]
+    pop, push = stack.pop, stack.append
+    while stack:
+        src, dst = pop()
+        for k, v in (src.items() if type(src) is _DICT else enumerate(src)):
+            t = type(v)
+            if t in scalars:
+                dst[k] = v
+                continue
+            if t is _OT:
+                v = v._data
+                t = type(v)
+            if t is _DICT:
+                out = {}
+                push((v, out))
+            elif t is _LIST:
+                out = [None] * len(v)
+                push((v, out))
+            elif t in scalars or ((t is tuple or t is frozenset)
+                                  and all(type(x) in scalars for x in v)):
+                out = v
+            else:
+                out = deepcopy(ObjectTree._unwrap(v), memo)
+            dst[k] = out
+    return root
+
+
+def _restore(cls: type, data: Any, schema: Any) -> ObjectTree:
+    """Unpickle target for ObjectTree.__reduce_ex__ (schema is keyword-only)."""
+    return cls(data, schema=schema)
+
+_ABSENT = object()
+_MISSING = object()
+
+
+class _ColumnarRow(Mapping):
+    """Row view of an ObjectTreeColumnar: dot-access reads/writes the columns."""
+
+    __slots__ = ('_owner', '_index')
+
+    def __init__(self, owner: 'ObjectTreeColumnar', index: int):
+        object.__setattr__(self, '_owner', owner)
+        object.__setattr__(self, '_index', index)
+
+    def __getattr__(self, key: str) -> Any:
+        if key.startswith('_'):
+            return object.__getattribute__(self, key)
+        col = self._owner._columns.get(key)
+        if col is None or col[self._index] is _ABSENT:
+            raise AttributeError(f"'{type(self).__name__}' has no attribute '{key}'")
+        return col[self._index]
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        self._owner._set(self._index, key, value)
+
+    def __getitem__(self, key: str) -> Any:
+        col = self._owner._columns.get(key)
+        if col is None or col[self._index] is _ABSENT:
+            raise KeyError(key)
+        return col[self._index]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._owner._set(self._index, key, value)
+
+    def __iter__(self) -> Iterator:
+        i = self._index
+        return (k for k, col in self._owner._columns.items() if col[i] is not _ABSENT)
+
+    def __len__(self) -> int:
+        i = self._index
+        return sum(1 for col in self._owner._columns.values() if col[i] is not _ABSENT)
+
+    def to_dict(self) -> dict:
+        i = self._index
+        return {k: ObjectTree._unwrap(col[i]) for k, col in self._owner._columns.items()
+                if col[i] is not _ABSENT}
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Mapping):
+            return self.to_dict() == (other.to_dict() if hasattr(other, 'to_dict') else dict(other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class ObjectTreeColumnar(Sequence):
+    """Opt-in struct-of-arrays store for a list of records sharing one property set.
+
+    Takes an array schema whose items.properties names every field; each field
+    is kept as one column list instead of one ObjectTree per record. Indexing
+    returns a row view with dot-access; writes are type-checked against the
+    property schema. Missing fields read as absent; to_dict() rebuilds rows.
+    """
+
+    __slots__ = ('_columns', '_length', '_schema', '_props')
+
+    def __init__(self, rows: Sequence[Mapping] = (), *, schema: Mapping):
+        schema = _schema_tree(schema)
+        items = schema.get('items')
+        props = items.get('properties') if type(items) is _OT else None
+        if type(props) is not _OT or not props:
+            raise ValueError("ObjectTreeColumnar requires a schema with items.properties")
+        object.__setattr__(self, '_schema', schema)
+        object.__setattr__(self, '_props', props._data)
+        object.__setattr__(self, '_columns', {k: [] for k in self._props})
+        object.__setattr__(self, '_length', 0)
+        for row in rows:
+            self.append(row)
+
+    def append(self, row: Mapping) -> None:
+        """Add one record; its keys must be a subset of items.properties."""
+        columns, props = self._columns, self._props
+        extra = row.keys() - columns.keys()
+        if extra:
+            raise ValueError(f"record fields outside items.properties: {sorted(extra)}")
+        for k, col in columns.items():
+            v = row[k] if k in row else _ABSENT
+            col.append(v if v is _ABSENT else ObjectTree._wrap_static(v, props[k]))
+        object.__setattr__(self, '_length', self._length + 1)
+
+    def _set(self, index: int, key: str, value: Any) -> None:
+        col = self._columns.get(key)
+        if col is None:
+            raise TypeError(f"'{key}' is not in items.properties of this columnar store")
+        wrapped = ObjectTree._wrap_static(value, self._props[key])
+        SchemaAPI._validate_field(self._props[key], wrapped, field=key)
+        col[index] = wrapped
+        _mark_mutated()
+
+    def column(self, key: str) -> list:
+        """Values of one field across all records (None where absent)."""
+        return [None if v is _ABSENT else v for v in self._columns[key]]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [_ColumnarRow(self, i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("ObjectTreeColumnar index out of range")
+        return _ColumnarRow(self, index)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator:
+        return (_ColumnarRow(self, i) for i in range(self._length))
+
+    def to_dict(self) -> list:
+        unwrap = ObjectTree._unwrap
+        cols = self._columns.items()
+        return [{k: unwrap(col[i]) for k, col in cols if col[i] is not _ABSENT}
+                for i in range(self._length)]
+
+    to_native = to_dict
+
+    def __eq__(self, other) -> bool:
+        if type(other) is ObjectTreeColumnar:
+            return self.to_dict() == other.to_dict()
+        if type(other) is _LIST:
+            return self.to_dict() == ObjectTree._unwrap(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ObjectTreeColumnar({self.to_dict()!r})"
+
+
+_COL = ObjectTreeColumnar
+
+
 class ObjectTreeEncoder(json.JSONEncoder):
-    """JSON encoder supporting ObjectTree."""
+    """JSON encoder supporting ObjectTree.
+
+    Trees are encoded from their own store: the C encoder walks the raw
+    dicts/lists in place and only calls default() for nested ObjectTree
+    nodes, so no unwrapped copy of the tree is built.
+    """
+
+    def iterencode(self, o: Any, _one_shot: bool = False) -> Iterator[str]:
+        if type(o) is _OT:
+            o = o._data
+        elif type(o) is _COL:
+            o = o.to_dict()
+        return super().iterencode(o, _one_shot)
 
     def default(self, obj: Any) -> Any:
         if isinstance(obj, ObjectTree):
+            return obj._data
+        if isinstance(obj, (ObjectTreeColumnar, _ColumnarRow)):
             return obj.to_dict()
         return super().default(obj)
+
+
+def dumps(obj: Any, **kwargs) -> str:
+    """Serialize an ObjectTree (or data containing trees) to a JSON string.
+
+    kwargs go to json.dumps; with a non-ObjectTree encoder class the tree is
+    unwrapped with to_dict() first.
+    """
+    cls = kwargs.setdefault('cls', ObjectTreeEncoder)
+    if (type(obj) is _OT or type(obj) is _COL) and not (
+        isinstance(cls, type) and issubclass(cls, ObjectTreeEncoder)
+    ):
+        obj = obj.to_dict()
+    return json.dumps(obj, **kwargs)
+
+
+def path(tree: Any, dotted: str) -> Any:
+    """Dot-access by path string: path(o, 'a.b.c') is o.a.b.c.
+
+    The accessor for each path is built once and cached.
+    """
+    return _path_getter(dotted)(tree)
@@ -5,7 +5,7 @@ import pickle
 
 import pytest
 
-from schema2object import ObjectTree, ObjectTreeEncoder
+from schema2object import ObjectTree, ObjectTreeEncoder, dumps, path
 
 
 # === Construction ===
@@ -74,12 +74,42 @@ class TestDefaultFill:
             }
         }
         o = ObjectTree({'config': {}}, schema=schema)
+        assert o.to_dict() == {'config': {'debug': False}}
         assert o.config.debug is False
 
     def test_no_schema_no_fill(self):
         o = ObjectTree({'a': 1})
         assert o.to_dict() == {'a': 1}
 
+    def test_list_items_get_defaults(self):
+        schema = {'items': {'properties': {'d': {'default': 1}}}}
+        rows = ObjectTree([{}, {'d': 2}], schema=schema)
+        assert rows.to_dict() == [{'d': 1}, {'d': 2}]
+        assert pickle.loads(pickle.dumps(rows)).to_dict() == [{'d': 1}, {'d': 2}]
+
+    def test_rewrap_list_tree_with_its_schema(self):
+        rows = ObjectTree([{'a': 1}, 2], schema={'items': {'type': 'object'}})
+        again = ObjectTree(rows, schema=rows._schema)
+        assert again.to_dict() == [{'a': 1}, 2]
+        with pytest.raises(TypeError):
+            rows | {}
+
+    def test_defaults_cached_on_schema(self):
+        schema = ObjectTree({'properties': {
+            'tags': {'type': 'array', 'default': []},
+            'cfg': {'type': 'object', 'default': {'debug': False}},
+        }})
+        raw = {}
+        a = ObjectTree(raw, schema=schema)
+        b = ObjectTree({}, schema=schema)
+        assert ObjectTree._defaults(schema) == {'tags': [], 'cfg': {'debug': False}}
+        assert ObjectTree._defaults(schema) is ObjectTree._defaults(schema)
+        assert raw == {}
+        a.tags.append(1)
+        a.cfg.debug = True
+        assert b.tags == [] and b.cfg.debug is False
+        assert schema.properties.cfg.default.debug is False
+
 
 # === Attribute Access ===
 
@@ -109,6 +139,15 @@ class TestAttributeAccess:
         with pytest.raises(AttributeError):
             del o.nonexistent
 
+    def test_path(self):
+        o = ObjectTree({'a': {'b': {'c': 42}}, 'path': '/tmp'})
+        assert path(o, 'a.b.c') == 42
+        assert path(o, 'a.b') is o.a.b
+        assert o.path == '/tmp'
+        assert path(o, 'path') == '/tmp'
+        with pytest.raises(AttributeError):
+            path(o, 'a.x.c')
+
 
 # === Dict Protocol ===
 
@@ -148,6 +187,15 @@ class TestDictProtocol:
         assert len(o) == 0
         assert o.to_dict() == {}
 
+    def test_popitem_and_reversed(self):
+        o = ObjectTree({'a': 1, 'b': 2})
+        assert list(reversed(o)) == ['b', 'a']
+        assert o.popitem() == ('a', 1)
+        assert o.popitem() == ('b', 2)
+        with pytest.raises(KeyError):
+            o.popitem()
+        assert 'a' not in ObjectTree([1, 2])
+
 
 # === Wrapping ===
 
@@ -179,6 +227,93 @@ class TestWrapping:
         with pytest.raises(TypeError):
             o.user.name = 123
 
+    def test_exotic_mapping_and_sequence_wrapped(self):
+        from collections import OrderedDict
+        from types import MappingProxyType
+        o = ObjectTree({'a': OrderedDict(x=1), 'c': ({'z': 3},)})
+        assert isinstance(o.a, ObjectTree) and o.a.x == 1
+        assert o.c[0].z == 3
+        # Non-dict Mapping implementations are accepted at the top level only
+        assert ObjectTree(MappingProxyType({'k': 1})).k == 1
+
+    def test_children_wrapped_on_access(self):
+        raw = {'a': {'b': {'c': 1}}, 'n': 1}
+        o = ObjectTree(raw)
+        assert type(o._data['a']) is dict
+        child = o.a
+        assert isinstance(child, ObjectTree)
+        assert o._data['a'] is child
+        assert o.a is child
+        assert type(child._data['b']) is dict
+        o.a.b.c = 2
+        assert raw == {'a': {'b': {'c': 1}}, 'n': 1}
+        assert o.to_dict() == {'a': {'b': {'c': 2}}, 'n': 1}
+        assert all(isinstance(v, ObjectTree) for v in ObjectTree({'x': {}, 'y': {}}).values())
+        assert isinstance(ObjectTree({'x': {}}).get('x'), ObjectTree)
+        assert isinstance(ObjectTree({'x': {}}).pop('x'), ObjectTree)
+
+    def test_tree_isolated_from_input(self):
+        d = {'a': {'b': 1, 'c': {'d': [1, {'e': 2}]}}}
+        o = ObjectTree(d)
+        d['a']['b'] = 99
+        d['a']['c']['d'][1]['e'] = 99
+        assert o.to_dict() == {'a': {'b': 1, 'c': {'d': [1, {'e': 2}]}}}
+        items = [{'x': 1}]
+        rows = ObjectTree(items)
+        items[0]['x'] = 2
+        assert rows[0].x == 1
+        # copy() shares children whether or not they were read before
+        c = o.copy()
+        o.a.b = 5
+        assert c.a.b == 5
+
+    def test_sequence_items_wrapped_on_access(self):
+        schema = {'items': {'properties': {'n': {'type': 'integer'}}}}
+        o = ObjectTree([{'n': 1}, {'n': 2}, 3], schema=schema)
+        assert type(o._data[0]) is dict
+        first = o[0]
+        assert isinstance(first, ObjectTree)
+        assert o[0] is first and o._data[0] is first
+        with pytest.raises(TypeError):
+            first.n = 'x'
+        assert type(o._data[1]) is dict
+        assert all(isinstance(v, ObjectTree) for v in o[:2])
+        assert o[-1] == 3
+        assert o.to_dict() == [{'n': 1}, {'n': 2}, 3]
+
+    def test_store_propagates_item_schemas(self):
+        schema = {'properties': {
+            'rows': {'items': {'properties': {'n': {'type': 'integer'}}}},
+            'any': True,
+        }}
+        o = ObjectTree({'rows': [{'n': 1}], 'any': [{'x': 1}], 'k': 'v'}, schema=schema)
+        with pytest.raises(TypeError):
+            o.rows[0].n = 'bad'
+        assert o.any[0].x == 1
+        o.any = [2]
+        assert o.any == [2]
+
+    def test_child_schema_memoized(self):
+        o = ObjectTree({'a': 1}, schema={'properties': {'a': {'type': 'integer'}}, 'items': {'type': 'string'}})
+        assert o._child_schema('a') is o._schema.properties.a
+        cache = o._child_schema_cache
+        assert o._child_schema('b') is None
+        assert o._child_schema(0) is o._schema['items']
+        assert o._child_schema_cache is cache
+        o._schema = ObjectTree({'properties': {'a': {'type': 'string'}}})
+        assert o._child_schema_cache is None
+        o.a = 'now a string'
+
+    def test_property_names_interned(self):
+        schema = ObjectTree({'properties': {'status': {'type': 'string'}}})
+        k1 = ''.join(['sta', 'tus'])
+        k2 = ''.join(['sta', 'tus'])
+        assert k1 is not k2
+        a = ObjectTree({k1: 'x', 'other': 1}, schema=schema)
+        b = ObjectTree({k2: 'y'}, schema=schema)
+        assert next(iter(a)) is next(iter(b))
+        assert a.to_dict() == {'status': 'x', 'other': 1}
+
 
 # === Serialization ===
 
@@ -193,6 +328,41 @@ class TestSerialization:
         result = json.dumps(o, cls=ObjectTreeEncoder)
         assert json.loads(result) == {'a': 1, 'b': [2, 3]}
 
+    def test_dumps_helper(self):
+        o = ObjectTree({'a': {'b': [1, {'c': None}]}})
+        assert json.loads(dumps(o)) == o.to_dict()
+        assert dumps(o, sort_keys=True) == json.dumps(o.to_dict(), sort_keys=True)
+        assert json.loads(dumps({'wrapped': o})) == {'wrapped': o.to_dict()}
+
+    def test_to_dict_unwraps_subclasses(self):
+        class Config(ObjectTree):
+            pass
+
+        o = ObjectTree({'c': Config({'a': 1}), 'l': [Config({'b': 2})]})
+        d = o.to_dict()
+        assert d == {'c': {'a': 1}, 'l': [{'b': 2}]}
+        assert type(d['c']) is dict and type(d['l'][0]) is dict
+        assert json.loads(json.dumps(d)) == d
+        assert Config({'a': {'b': 1}}).to_dict() == {'a': {'b': 1}}
+
+    def test_encoder_reads_stores_in_place(self, monkeypatch):
+        class Counting(ObjectTreeEncoder):
+            seen = []
+
+            def default(self, obj):
+                result = super().default(obj)
+                Counting.seen.append(result is obj._data)
+                return result
+
+        o = ObjectTree({'a': {'b': {'c': 1}}, 'l': [{'x': 1}], 'w': {'k': 2}})
+        o.w
+        expected = o.to_dict()
+        monkeypatch.setattr(ObjectTree, 'to_dict', None)
+        assert json.loads(json.dumps(o, cls=Counting)) == expected
+        assert json.loads(dumps({'t': o})) == {'t': expected}
+        # Only the wrapped nodes reach default(): the list item and o.w
+        assert Counting.seen == [True, True]
+
     def test_pickle_roundtrip(self):
         o = ObjectTree({'a': {'b': 1}, 'c': [2, 3]})
         data = pickle.dumps(o)
@@ -200,6 +370,38 @@ class TestSerialization:
         assert restored.to_dict() == o.to_dict()
         assert isinstance(restored.a, ObjectTree)
 
+    def test_pickle_shares_schema(self):
+        schema = {'properties': {'n': {'type': 'integer'}}}
+        a = ObjectTree({'n': 1}, schema=schema)
+        b = ObjectTree({'n': 2}, schema=a._schema)
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            ra, rb = pickle.loads(pickle.dumps([a, b], protocol=protocol))
+            assert ra == {'n': 1} and rb == {'n': 2}
+            assert ra._schema is rb._schema
+            with pytest.raises(TypeError):
+                rb.n = 'x'
+
+    def test_unpickle_old_state_format(self):
+        # Written by releases that pickled {'data', 'schema'} via __getstate__
+        old = (b'\x80\x02cschema2object.tree\nObjectTree\nq\x00)\x81q\x01}q\x02(X\x04\x00'
+               b'\x00\x00dataq\x03}q\x04(X\x01\x00\x00\x00nq\x05K\x01X\x04\x00\x00\x00tags'
+               b'q\x06]q\x07X\x01\x00\x00\x00aq\x08auX\x06\x00\x00\x00schemaq\t}q\nX\n\x00'
+               b'\x00\x00propertiesq\x0b}q\x0ch\x05}q\rX\x04\x00\x00\x00typeq\x0eX\x07\x00'
+               b'\x00\x00integerq\x0fsssub.')
+        o = pickle.loads(old)
+        assert o.to_dict() == {'n': 1, 'tags': ['a']}
+        with pytest.raises(TypeError):
+            o.n = 'x'
+
+    def test_to_dict_deep_tree(self):
+        node = ObjectTree({'leaf': [1]})
+        for _ in range(5000):
+            node = ObjectTree({'a': node})
+        out = node.to_dict()
+        for _ in range(5000):
+            out = out['a']
+        assert out == {'leaf': [1]}
+
 
 # === Type Binding ===
 
@@ -302,6 +504,19 @@ class TestTypeBinding:
         o.update({'age': 25})
         assert o.age == 25
 
+    def test_update_is_atomic(self):
+        schema = {'properties': {'age': {'type': 'integer'}}}
+        o = ObjectTree({'age': 1}, schema=schema)
+        with pytest.raises(TypeError):
+            o.update({'name': 'x', 'age': 'bad'})
+        with pytest.raises(TypeError):
+            o.update({'name': 'x'}, age='bad')
+        with pytest.raises(TypeError):
+            o |= {'name': 'x', 'age': 'bad'}
+        assert o.to_dict() == {'age': 1}
+        o.update([('name', 'y')], age=2)
+        assert o.to_dict() == {'age': 2, 'name': 'y'}
+
     def test_schema_as_objecttree(self):
         schema_obj = ObjectTree({'properties': {'age': {'type': 'integer'}}})
         o = ObjectTree({'age': 10}, schema=schema_obj)
@@ -310,6 +525,18 @@ class TestTypeBinding:
         o.age = 20
         assert o.age == 20
 
+    def test_validators_built_once_per_schema(self):
+        schema = ObjectTree({'properties': {'age': {'type': 'integer'}, 'any': {}}})
+        a = ObjectTree({}, schema=schema)
+        b = ObjectTree({}, schema=schema)
+        a.age = 1
+        validators = a._field_validators()
+        assert set(validators) == {'age'}
+        b.age = 2
+        assert b._field_validators() is validators
+        with pytest.raises(TypeError, match="'age': expected type 'integer', got str"):
+            b['age'] = 'x'
+
 
 # === Python Protocols ===
 
@@ -325,6 +552,24 @@ class TestPythonProtocols:
         assert o != {'a': 1}
         assert o == ObjectTree({'a': 1, 'b': 2})
 
+    def test_eq_nested_without_unwrapping(self):
+        o = ObjectTree({'a': {'b': [1, {'c': 2}]}, 'n': None})
+        assert o == {'a': {'b': [1, {'c': 2}]}, 'n': None}
+        assert o == ObjectTree({'a': {'b': [1, {'c': 2}]}, 'n': None})
+        assert o != {'a': {'b': [1, {'c': 3}]}, 'n': None}
+        assert o != {'a': {'b': [1]}, 'n': None}
+        assert o != {'a': {'b': (1, {'c': 2})}, 'n': None}
+        assert o != {'a': {'x': [1, {'c': 2}]}, 'n': None}
+        assert type(o._data['a']) is dict
+        def chain(n):
+            root = leaf = {}
+            for _ in range(n):
+                leaf['x'] = {}
+                leaf = leaf['x']
+            return root
+        assert ObjectTree(chain(5000)) == ObjectTree(chain(5000))
+        assert ObjectTree(chain(5000)) != ObjectTree(chain(4999))
+
     def test_bool(self):
         assert bool(ObjectTree({'a': 1})) is True
         assert bool(ObjectTree()) is False
@@ -340,6 +585,77 @@ class TestPythonProtocols:
         deep.a.b = [99]
         assert o.a.b == [1, 2]
 
+    def test_deepcopy_fallback_and_shared_schema(self):
+        schema = {'properties': {'n': {'type': 'integer'}}}
+        o = ObjectTree({'n': 1, 'm': {1: 'int key'}, 'f': float('nan')}, schema=schema)
+        d = copy.deepcopy(o)
+        assert d._schema is o._schema
+        assert d.m == {1: 'int key'}
+        assert d.m is not o.m
+        plain = ObjectTree({'a': [{'b': 1.0}]})
+        dp = copy.deepcopy(plain)
+        assert dp == plain and type(dp.a[0].b) is float
+        dp.a[0].b = 2
+        assert plain.a[0].b == 1.0
+
+    def test_deepcopy_leaves(self):
+        frozen = frozenset({1, 'a'})
+        o = ObjectTree({'f': frozen, 's': {1, 2}, 'a': {'b': {}}})
+        d = copy.deepcopy(o)
+        assert d == o
+        assert d.f is frozen
+        assert d.s == {1, 2} and d.s is not o.s
+        assert type(d._data['a']) is dict
+        d.a.b.c = 1
+        assert o.a.b == {}
+
+    def test_copy_reuses_wrapped_children(self):
+        o = ObjectTree({'a': {'b': 1}, 'n': 1}, schema={'properties': {'n': {'type': 'integer'}}})
+        wrapped = o.a
+        c = o.copy()
+        assert c.a is wrapped
+        assert c._schema is o._schema
+        c.n = 2
+        assert o.n == 1
+        seq = ObjectTree([{'x': 1}])
+        assert ObjectTree(seq).to_dict() == [{'x': 1}]
+
+    def test_schemaless_rewrap_drops_child_schemas(self):
+        o = ObjectTree({}, schema={'properties': {'a': {'properties': {'n': {'type': 'integer'}}}}})
+        p = ObjectTree(o)
+        p.a = {'n': 1}
+        p.a.n = 'x'
+        assert p.a.n == 'x'
+
+    def test_shallow_copy_keeps_data_as_is(self):
+        schema = {'properties': {'d': {'default': 0}}}
+        o = ObjectTree({'d': 1}, schema=schema)
+        del o.d
+        c = o.copy()
+        assert c.to_dict() == {}
+        assert ObjectTree([1, 2]).copy().to_dict() == [1, 2]
+        assert ObjectTree('scalar').copy().to_dict() == 'scalar'
+
+    def test_slotted(self):
+        o = ObjectTree({'_data_like': 1, 'x': 2})
+        assert not hasattr(o, '__dict__')
+        assert ObjectTree.__slots__ == (
+            '_data', '_schema', '_child_schema_cache', '_composition_cache')
+        assert o.x == 2 and o['_data_like'] == 1
+
+    def test_copy_module_uses_copy_and_keeps_subclass(self, monkeypatch):
+        class Config(ObjectTree):
+            __slots__ = ()
+
+        c = Config({'a': {'b': 1}})
+        c.a
+        monkeypatch.setattr(ObjectTree, '__reduce_ex__', None)
+        shallow = copy.copy(c)
+        assert type(shallow) is Config
+        assert shallow.a is c.a
+        shallow.x = 1
+        assert 'x' not in c
+
 
 # === Dict Merge ===
 
@@ -357,6 +673,28 @@ class TestDictMerge:
         a |= {'y': 2, 'z': 3}
         assert a.to_dict() == {'x': 1, 'y': 2, 'z': 3}
 
+    @pytest.mark.parametrize('accessed', [False, True])
+    def test_merge_leaves_other_untouched(self, accessed):
+        a = ObjectTree({'x': {'n': 1}})
+        b = ObjectTree({'y': {'z': 1}, 'l': [{'k': 1}]})
+        if accessed:
+            a.x, b.y, b.l[0]
+        c = a | b
+        c.y.z = 2
+        c.l[0].k = 2
+        assert b.y.z == 1 and b.l[0].k == 1
+        c = a | {}
+        c.x.n = 9
+        assert a.x.n == 1
+        d = ObjectTree({})
+        d.update(b)
+        d.y.z = 3
+        d.l[0].k = 3
+        assert b.to_dict() == {'y': {'z': 1}, 'l': [{'k': 1}]}
+        a.update(b)
+        a.update([('w', 0)])
+        assert a.to_dict() == {'x': {'n': 1}, 'y': {'z': 1}, 'l': [{'k': 1}], 'w': 0}
+
     def test_or_override(self):
         a = ObjectTree({'x': 1, 'y': 'old'})
         b = {'y': 'new', 'z': 3}
@@ -662,6 +1000,24 @@ class TestSchemaAPI:
         o = ObjectTree({'a': 1})
         assert o.project() is o
 
+    def test_project_conforming_returns_self(self):
+        schema = {'properties': {'name': {'type': 'string'}, 'age': {'type': 'integer'}}}
+        o = ObjectTree({'name': 'Alice'}, schema=schema)
+        assert o.project() is o
+        # Nothing dropped: the projection is the tree itself, writes are shared
+        o.project().age = 3
+        assert o.age == 3
+        # Fields dropped: a new tree, independent at the top level
+        extra = ObjectTree({'name': 'Alice', 'x': 1}, schema=schema)
+        projected = extra.project()
+        projected.age = 3
+        assert 'age' not in extra
+        branch = {'oneOf': [{'properties': {'name': {'type': 'string'}}}]}
+        b = ObjectTree({'name': 'Alice'}, schema=branch)
+        projected = b.project()
+        assert projected is not b
+        assert projected._schema is b._schema.oneOf[0]
+
     def test_project_ambiguous_oneof(self):
         schema = {
             'oneOf': [
@@ -855,6 +1211,28 @@ class TestDraft07Keywords:
         o.ids = [1, 2, 3]
         assert o.ids == [1, 2, 3]
 
+    def test_unique_items_mixed_members(self):
+        from schema2object.api import _check_value
+        schema = {'uniqueItems': True}
+        assert _check_value(schema, ['a', 'b', 3])[0]
+        assert _check_value(schema, ['a', 'b', 'a']) == (False, "duplicate item 'a' in array")
+        assert _check_value(schema, [{'a': 1}, [1], {'a': 2}])[0]
+        assert _check_value(schema, [1, {'a': 1}, {'a': 1}]) == (False, "duplicate item {'a': 1} in array")
+
+    def test_numeric_items_bulk_check(self):
+        from schema2object.api import _check_value
+        schema = {'items': {'type': 'number', 'exclusiveMinimum': 0, 'maximum': 10,
+                            'multipleOf': 0.5, 'title': 'scores'}}
+        assert _check_value(schema, [0.5, 1, 10, 2.5]) == (True, '')
+        assert _check_value(schema, [1, 10.5]) == (False, '[1]: 10.5 > maximum 10')
+        assert _check_value(schema, [1, 0]) == (False, '[1]: 0 <= exclusiveMinimum 0')
+        assert _check_value(schema, [1, 1.2])[1] == '[1]: 1.2 is not a multiple of 0.5'
+        assert _check_value(schema, [1, True])[1] == "[1]: expected type 'number', got bool"
+        ints = {'items': {'type': 'integer', 'minimum': 0}}
+        assert _check_value({'items': {'minimum': 0}}, [float('nan'), -5])[1] == '[1]: -5 < minimum 0'
+        assert _check_value(ints, list(range(1000)))[0]
+        assert _check_value(ints, [1, 2.0])[1] == "[1]: expected type 'integer', got float"
+
     # --- additionalProperties ---
 
     def test_additional_properties_false(self):
@@ -981,6 +1359,15 @@ class TestErrorMessages:
         assert '.user' in reason
         assert '.age' in reason
 
+    def test_nested_error_path_across_typed_levels(self):
+        from schema2object.api import _check_value
+        schema = {'properties': {'a': {'type': 'object', 'properties': {
+            'b': {'properties': {'c': {'type': 'object', 'properties': {
+                'd': {'minimum': 1}}}}}}}}}
+        assert _check_value(schema, {'a': {'b': {'c': {'d': 2}}}}) == (True, '')
+        assert _check_value(schema, {'a': {'b': {'c': {'d': 0}}}}) == (
+            False, '.a: .b: .c: .d: 0 < minimum 1')
+
 
 # === Draft-07 Compliance Fixes ===
 
@@ -1024,6 +1411,30 @@ class TestTypeUnion:
         with pytest.raises(TypeError):
             o.val = 123
 
+    def test_type_predicates(self):
+        from schema2object.api import _TYPE_CHECKS, _type_predicate
+        assert _TYPE_CHECKS['integer'](3) and not _TYPE_CHECKS['integer'](True)
+        assert _TYPE_CHECKS['number'](1.5) and not _TYPE_CHECKS['number'](False)
+        assert _TYPE_CHECKS['boolean'](True) and not _TYPE_CHECKS['boolean'](1)
+        assert _type_predicate('integer') is _TYPE_CHECKS['integer']
+        either = _type_predicate(('integer', 'boolean'))
+        assert either(1) and either(True) and not either('1')
+        assert _type_predicate(('nonsense',))(object())
+
+    def test_int_subclasses_still_accepted(self):
+        import enum
+        from schema2object.api import _check_value
+
+        class Level(enum.IntEnum):
+            LOW = 1
+
+        for schema in ({'type': 'integer'}, {'type': 'number', 'minimum': 0},
+                       {'type': ['integer', 'null']}):
+            assert _check_value(schema, Level.LOW)[0]
+            assert _check_value(schema, 1)[0]
+            assert not _check_value(schema, True)[0]
+        assert not _check_value({'minimum': 5}, Level.LOW)[0]
+
 
 class TestAdditionalPropertiesNoProperties:
     """additionalProperties: false without properties key."""
@@ -1050,6 +1461,57 @@ class TestAdditionalPropertiesNoProperties:
         ok, reason = _check_value(schema, {'a': 1, 'b': 2})
         assert not ok
 
+    def test_any_pattern_alternation(self):
+        from schema2object.api import _any_pattern, _check_value
+        assert _any_pattern([]) is None
+        joined = _any_pattern(['^x_', '_id$', 'a|b'])
+        assert joined.__self__.pattern == '(?:^x_)|(?:_id$)|(?:a|b)'
+        assert [bool(joined(k)) for k in ('x_1', 'user_id', 'cab', 'zzz')] == [True, True, True, False]
+        backref = _any_pattern(['^(.)\\1', '^z'])
+        assert backref('aa') and backref('zq') and not backref('ab')
+        flags = _any_pattern(['(?i)^abc', '^z'])
+        assert flags('ABC') and not flags('q')
+        # The inline flag stays local to its own pattern
+        assert not flags('Zq')
+        schema = {'patternProperties': {'^a': {}, '(?i)^b': {}}, 'additionalProperties': False}
+        assert not _check_value(schema, {'A': 1})[0]
+        assert _check_value(schema, {'B': 1, 'a': 2})[0]
+
+    def test_pattern_properties_excuse_extra_keys(self):
+        from schema2object.api import _check_value
+        schema = {
+            'properties': {'a': {}},
+            'patternProperties': {'^x_': {}, '_id$': {}},
+            'additionalProperties': False,
+        }
+        assert _check_value(schema, {'a': 1, 'x_1': 2, 'user_id': 3})[0]
+        ok, reason = _check_value(schema, {'a': 1, 'x_1': 2, 'other': 3})
+        assert not ok and reason == "additional properties not allowed: {'other'}"
+        # Key decisions are cached per name; repeated records stay correct
+        literal = {'patternProperties': {'^x_': {}}, 'additionalProperties': False}
+        for _ in range(3):
+            assert _check_value(literal, {'x_1': 1})[0]
+            assert not _check_value(literal, {'x_1': 1, 'y': 2})[0]
+
+    def test_pattern_and_additional_schemas_share_one_walk(self):
+        from schema2object.api import _check_value
+        schema = {
+            'properties': {'a': {}},
+            'patternProperties': {'^n_': {'type': 'integer'}},
+            'additionalProperties': {'type': 'string'},
+        }
+        assert _check_value(schema, {'a': None, 'n_1': 1, 'other': 'x'})[0]
+        ok, reason = _check_value(schema, {'n_1': 'x', 'other': 'x'})
+        assert not ok and reason.startswith(".n_1 (pattern '^n_'):")
+        ok, reason = _check_value(schema, {'n_1': 1, 'other': 2})
+        assert not ok and reason.startswith('.other (additionalProperties):')
+        # Several failures: the first pattern's is reported, whatever the key order
+        ordered = {'patternProperties': {'^s_': {'type': 'string'}, '^n_': {'type': 'integer'}}}
+        ok, reason = _check_value(ordered, {'n_1': 'x', 's_1': 1, 's_2': 2})
+        assert not ok and reason.startswith(".s_1 (pattern '^s_'):")
+        ok, reason = _check_value(ordered, {'n_1': 'x', 'n_2': 'y'})
+        assert reason.startswith(".n_1 (pattern '^n_'):")
+
 
 class TestDependencies:
     """Draft-07 dependencies keyword (array and schema forms)."""
@@ -1069,6 +1531,17 @@ class TestDependencies:
         ok, _ = _check_value(schema, {'credit_card': '1234', 'billing_address': '123 St'})
         assert ok
 
+    def test_array_form_reports_first_missing_in_order(self):
+        from schema2object.api import _check_value
+        deps = ['z', 'a', 'm']
+        for kw in ('dependencies', 'dependentRequired'):
+            schema = {kw: {'k': deps}}
+            ok, reason = _check_value(schema, {'k': 1, 'z': 1})
+            assert not ok
+            assert reason == "'k' requires 'a' to be present"
+            ok, _ = _check_value(schema, {'k': 1, 'z': 1, 'a': 1, 'm': 1})
+            assert ok
+
     def test_schema_form(self):
         from schema2object.api import _check_value
         schema = {
@@ -1095,6 +1568,83 @@ class TestDependencies:
         ok, _ = _check_value(schema, {'credit_card': '1234', 'billing_address': '123 St'})
         assert ok
 
+    def test_only_present_triggers_are_checked(self):
+        from collections import OrderedDict
+        from schema2object.api import _check_value
+        schema = {
+            'dependencies': {'a': ['x'], 'b': {'required': ['y']}},
+            'dependentRequired': {'b': ['z']},
+        }
+        assert _check_value(schema, {'x': 1, 'y': 2})[0]
+        assert _check_value(schema, {'b': 1, 'y': 2})[1] == "'b' requires 'z' to be present"
+        assert _check_value(schema, {'b': 1, 'z': 2})[1] == "dependency 'b': missing required field 'y'"
+        assert not _check_value(schema, OrderedDict(a=1))[0]
+
+
+class TestRefs:
+    """Local $ref pointers resolved when the schema is compiled."""
+
+    def test_definitions_ref(self):
+        from schema2object.api import _check_value
+        schema = {
+            'definitions': {'address': {'type': 'object', 'required': ['city']}},
+            'properties': {'home': {'$ref': '#/definitions/address'}},
+        }
+        assert _check_value(schema, {'home': {'city': 'Oslo'}})[0]
+        ok, reason = _check_value(schema, {'home': {}})
+        assert not ok and reason == ".home: missing required field 'city'"
+
+    def test_recursive_ref(self):
+        from schema2object.api import compile
+        validate = compile({
+            'type': 'object', 'required': ['v'],
+            'properties': {
+                'v': {'type': 'integer'},
+                'children': {'type': 'array', 'items': {'$ref': '#'}},
+            },
+        })
+        assert validate({'v': 1, 'children': [{'v': 2, 'children': [{'v': 3}]}]})[0]
+        ok, reason = validate({'v': 1, 'children': [{'v': 2, 'children': [{}]}]})
+        assert not ok and 'missing required field' in reason
+
+    def test_pointer_escapes_and_unresolved_refs(self):
+        from schema2object.api import _check_value
+        schema = {'$defs': {'a/b': {'minimum': 0}}, '$ref': '#/$defs/a~1b'}
+        assert not _check_value(schema, -1)[0]
+        # Refs that do not resolve locally are ignored, as before
+        assert _check_value({'$ref': '#/missing'}, -1)[0]
+        assert _check_value({'$ref': 'other.json#/a'}, -1)[0]
+        # $id anchors are not JSON pointers
+        assert _check_value({'properties': {'x': {'$ref': '#foo'}}}, {'x': 5})[0]
+
+    def test_large_recursive_schema(self):
+        from schema2object.api import compile
+        n = 1500
+        defs = {f'd{i}': {'properties': {'next': {'$ref': f'#/definitions/d{(i + 1) % n}'},
+                                         'v': {'type': 'integer'}}}
+                for i in range(n)}
+        validate = compile({'definitions': defs, '$ref': '#/definitions/d0'})
+        assert validate({'v': 1, 'next': {'v': 2, 'next': {'v': 3}}})[0]
+        ok, reason = validate({'next': {'next': {'v': 'x'}}})
+        assert not ok and reason == ".next: .next: .v: expected type 'integer', got str"
+
+    def test_field_refs_resolve_against_object_schema(self):
+        schema = {
+            'definitions': {'pos': {'minimum': 0}},
+            'properties': {
+                'n': {'$ref': '#/definitions/pos'},
+                # Property names that happen to be data keywords are still schemas
+                'default': {'$ref': '#/definitions/pos'},
+            },
+        }
+        o = ObjectTree({}, schema=schema)
+        with pytest.raises(TypeError):
+            o.n = -1
+        with pytest.raises(TypeError):
+            o['default'] = -1
+        o.n = 3
+        assert o.n == 3
+
 
 class TestMultipleOfFloat:
     """multipleOf with float tolerance."""
@@ -1116,6 +1666,20 @@ class TestMultipleOfFloat:
         ok, _ = _check_value({'multipleOf': 3}, 10)
         assert not ok
 
+    def test_scaled_decimal_divisors(self):
+        from schema2object.api import _multiple_checker
+        tenth = _multiple_checker(0.1)
+        assert all(tenth(v) for v in (0.3, 0.7, 7.7, -0.2, 1, 1e20))
+        assert not any(tenth(v) for v in (0.35, 0.01, float('inf'), float('nan')))
+        quarter = _multiple_checker(2.5)
+        assert quarter(7.5) and quarter(5) and not quarter(6)
+        tiny = _multiple_checker(1e-05)
+        assert tiny(0.00003) and not tiny(0.000035)
+        # Long decimal forms keep the remainder-based check
+        assert _multiple_checker(1 / 3)(1.0)
+        three = _multiple_checker(3)
+        assert three(9.0) and not three(9.5) and three(3 * 10 ** 30)
+
 
 class TestAdditionalPropertiesSchema:
     """additionalProperties as schema (not just boolean)."""
@@ -1186,3 +1750,575 @@ class TestAllOfMerge:
         merged_schema = object.__getattribute__(merged, '_schema')
         req = list(merged_schema.required)
         assert sorted(req) == ['a', 'b', 'c']
+
+    def test_required_union_keeps_first_seen_order(self):
+        from schema2object.api import _canonicalize
+        subs = [{'required': ['k%d' % (i % 7), 'shared']} for i in range(50)]
+        merged = _canonicalize({'required': ['z'], 'allOf': subs})
+        assert merged['required'] == ['z', 'k0', 'shared'] + ['k%d' % i for i in range(1, 7)]
+        assert 'required' not in _canonicalize({'allOf': [{'type': 'object'}]})
+
+    def test_canonicalize_folds_nested_all_of(self):
+        from schema2object.api import _canonicalize
+        schema = {
+            'type': ['number', 'string'],
+            'required': ['a'],
+            'properties': {'a': {'minimum': 0, 'maximum': 100}},
+            'allOf': [
+                {'allOf': [{'type': 'integer', 'required': ['b']}]},
+                {'required': ['a', 'c'], 'maxLength': 5,
+                 'properties': {'a': {'maximum': 10}, 'b': {}}},
+                {'maxLength': 3, 'minLength': 1},
+            ],
+        }
+        assert _canonicalize(schema) == {
+            'type': 'integer',
+            'required': ['a', 'b', 'c'],
+            'properties': {'a': {'minimum': 0, 'maximum': 10}, 'b': {}},
+            'maxLength': 3,
+            'minLength': 1,
+        }
+        assert _canonicalize({'allOf': [{'type': 'string'}, {'type': 'null'}]}) == {
+            'type': 'string', 'allOf': [{'type': 'null'}]}
+
+    def test_conflicting_keywords_stay_enforced(self):
+        from schema2object.api import _canonicalize, _check_value
+        schema = {'properties': {'x': {'type': 'string', 'not': {'const': 'a'}}},
+                  'allOf': [{'properties': {'x': {'type': 'integer'}}}]}
+        o = ObjectTree({}, schema=schema)
+        merged = o.all_of()
+        for bad in ('hello', 5, None):
+            with pytest.raises(TypeError):
+                merged.x = bad
+        assert merged._schema['properties']['x']['not'] == {'const': 'a'}
+        loose = {'allOf': [{'pattern': '^a'}, {'pattern': 'z$'}, {'enum': ['ab', 'az']},
+                           {'const': 'az'}]}
+        canon = _canonicalize(loose)
+        assert _check_value(canon, 'az')[0]
+        assert not _check_value(canon, 'ab')[0]
+        assert not _check_value(canon, 'bz')[0]
+        closed = _canonicalize({'allOf': [
+            {'properties': {'a': {}}, 'additionalProperties': False},
+            {'properties': {'b': {}}},
+        ]})
+        assert _check_value(closed, {'a': 1})[0]
+        assert not _check_value(closed, {'a': 1, 'b': 2})[0]
+
+    def test_boolean_property_schemas_never_loosen(self):
+        from schema2object.api import _canonicalize, _check_value
+        schema = {'properties': {'a': {'type': 'string'}},
+                  'allOf': [{'properties': {'a': True}}]}
+        assert _canonicalize(schema) == {'properties': {'a': {'type': 'string'}}}
+        assert not _check_value(_canonicalize(schema), {'a': 1})[0]
+        never = _canonicalize({'allOf': [{'properties': {'a': {'type': 'string'}}},
+                                         {'properties': {'a': False}}]})
+        assert never == {'properties': {'a': {'type': 'string'}},
+                         'allOf': [{'properties': {'a': False}}]}
+        first_true = _canonicalize({'allOf': [{'properties': {'a': True}},
+                                              {'properties': {'a': {'minimum': 1}}}]})
+        assert first_true['properties']['a'] == {'minimum': 1}
+
+    def test_all_of_merges_once_and_binds_tightest_bounds(self):
+        schema = {'properties': {'n': {'minimum': 0}},
+                  'allOf': [{'properties': {'n': {'maximum': 5}}}]}
+        o = ObjectTree({'n': 1}, schema=schema)
+        merged = o.all_of()
+        assert o.all_of()._schema is merged._schema
+        with pytest.raises(TypeError):
+            merged.n = 6
+        with pytest.raises(TypeError):
+            merged.n = -1
+        merged.n = 5
+
+
+class TestSchemaCompilation:
+    """Schemas compile once into a cached checker plan."""
+
+    def test_plan_cached_per_schema(self):
+        from schema2object.api import _compile_schema
+        schema = {'type': 'integer', 'minimum': 0}
+        assert _compile_schema(schema) is _compile_schema(schema)
+
+    def test_plan_only_has_needed_checkers(self):
+        from schema2object.api import _compile_schema
+        plan = _compile_schema({'type': 'string', 'minLength': 1})
+        # Strings always satisfy 'type', so only minLength runs for them.
+        assert len(plan[str]) == 1
+        assert len(plan[int]) == 1
+        assert not any(_compile_schema({}).values())
+
+    def test_generic_bucket_guards_subclasses(self):
+        from enum import IntEnum
+        from schema2object.api import _check_value
+
+        class Level(IntEnum):
+            LOW = 1
+
+        assert _check_value({'type': 'integer', 'minimum': 0}, Level.LOW)[0]
+        assert not _check_value({'type': 'integer', 'minimum': 2}, Level.LOW)[0]
+
+    def test_nested_plans_validate(self):
+        from schema2object.api import _check_value
+        schema = {'properties': {'a': {'properties': {'b': {'type': 'integer'}}}}}
+        assert _check_value(schema, {'a': {'b': 1}}) == (True, '')
+        ok, reason = _check_value(schema, {'a': {'b': 'x'}})
+        assert not ok
+        assert reason.startswith('.a: .b:')
+
+    def test_unique_items_nested_values(self):
+        from schema2object.api import _check_value
+        schema = {'uniqueItems': True}
+        assert _check_value(schema, [{'a': [1]}, {'a': [2]}])[0]
+        ok, reason = _check_value(schema, [{'a': [1]}, [1], {'a': [1]}])
+        assert not ok
+        assert 'duplicate' in reason
+
+    def test_branch_fast_reject(self):
+        from schema2object.api import _can_branch_match
+        assert _can_branch_match({'type': 'object', 'required': ['a']}, {'a': 1})
+        assert not _can_branch_match({'type': 'object', 'required': ['a']}, {'b': 1})
+        assert not _can_branch_match({'type': 'integer'}, True)
+        assert not _can_branch_match({'const': 'x'}, 'y')
+
+    def test_discriminator_table(self):
+        from schema2object.api import _discriminator
+        subs = [
+            {'properties': {'kind': {'const': 'a'}, 'x': {'type': 'integer'}}},
+            {'properties': {'kind': {'enum': ['b', 'c']}}},
+        ]
+        key, table = _discriminator(subs)
+        assert key == 'kind'
+        assert table == {'a': [0], 'b': [1], 'c': [1]}
+        assert _discriminator([{'properties': {'x': {'type': 'integer'}}}, {}]) is None
+
+    def test_discriminator_repeated_literals(self):
+        schema = {'oneOf': [
+            {'properties': {'k': {'enum': ['a', 'a', 1, True]}}},
+            {'properties': {'k': {'const': 'b'}}},
+        ]}
+        assert ObjectTree({'k': 'a'}, schema=schema).one_of()._schema is not None
+        assert len(ObjectTree({'k': 1}, schema=schema).any_of()) == 1
+
+    def test_discriminator_dispatch_one_of(self):
+        schema = {
+            'oneOf': [
+                {'properties': {'kind': {'const': 'a'}, 'x': {'type': 'integer'}}},
+                {'properties': {'kind': {'const': 'b'}, 'x': {'type': 'string'}}},
+            ]
+        }
+        o = ObjectTree({'kind': 'b', 'x': 'hi'}, schema=schema)
+        with pytest.raises(TypeError):
+            o.one_of().x = 1
+        with pytest.raises(TypeError, match="oneOf.*0"):
+            ObjectTree({'kind': 'z'}, schema=schema).one_of()
+
+    def test_match_cache_keeps_types_apart(self):
+        from schema2object.api import _check_match
+        schema = {'type': 'integer'}
+        assert _check_match(schema, 1) is True
+        assert _check_match(schema, True) is False
+        assert _check_match(schema, 1.5) is False
+        assert _check_match(schema, 1) is True
+
+    def test_any_of_branches_independent(self):
+        schema = {
+            'anyOf': [
+                {'properties': {'x': {'type': 'object'}}},
+                {'properties': {'x': {'type': 'object'}}},
+            ]
+        }
+        o = ObjectTree({'x': {'n': 1}}, schema=schema)
+        a, b = o.any_of()
+        a.x.n = 2
+        assert b.x.n == 1
+        assert o.x.n == 1
+
+    def test_zero_bounds_enforced(self):
+        from schema2object.api import _check_value
+        assert not _check_value({'minimum': 0}, -1)[0]
+        assert not _check_value({'maximum': 0}, 1)[0]
+        assert _check_value({'minimum': 0, 'maximum': 0}, 0)[0]
+
+    def test_multiple_of_large_integers_exact(self):
+        from schema2object.api import _check_value
+        assert _check_value({'multipleOf': 3}, 3 * 10**20)[0]
+        assert not _check_value({'multipleOf': 3}, 3 * 10**20 + 1)[0]
+        assert _check_value({'multipleOf': 3}, 9.0)[0]
+
+    def test_jit_validator_matches_plan(self):
+        from schema2object.api import _compile_schema, _jit_validator, _run_plan
+        schemas = [
+            {'type': 'integer', 'minimum': 5, 'multipleOf': 5},
+            {'type': ['string', 'null'], 'minLength': 2, 'pattern': '^a'},
+            {'type': 'number', 'exclusiveMaximum': 10, 'enum': [1, 2.5, 11]},
+            {'const': 'x'},
+        ]
+        values = [None, True, 0, 5, 7, 10, 2.5, 11, '', 'a', 'ab', 'ba', 'x']
+        for schema in schemas:
+            validate = _jit_validator(schema)
+            assert validate is not None
+            for v in values:
+                assert validate(v) == _run_plan(_compile_schema(schema), v), (schema, v)
+
+    def test_jit_skips_structural_schemas(self):
+        from schema2object.api import _jit_validator
+        assert _jit_validator({'type': 'array', 'items': {'type': 'integer'}}) is None
+        assert _jit_validator({'properties': {'a': {'required': ['b']}}}) is None
+
+    def test_jit_object_schema_matches_plan(self):
+        from schema2object.api import _compile_schema, _jit_validator, _run_plan
+        schema = {
+            'type': 'object', 'required': ['a', 'b'], 'maxProperties': 3,
+            'properties': {'a': {'type': 'integer', 'minimum': 0}, 'b': {'maxLength': 2}, 'c': {}},
+            'additionalProperties': False, 'dependencies': {'a': ['c']},
+        }
+        values = [None, {}, {'b': 'x'}, {'a': -1, 'b': 'x'}, {'a': 0, 'b': 'xyz'},
+                  {'a': 0, 'b': 'x'}, {'a': 0, 'b': 'x', 'c': 1}, {'a': 0, 'b': 'x', 'c': 1, 'd': 1}]
+        validate = _jit_validator(schema)
+        assert validate is not None
+        for v in values:
+            assert validate(v) == _run_plan(_compile_schema(schema), v), v
+
+    def test_compile_to_source(self):
+        from schema2object.api import compile_to_source
+        source = compile_to_source({'type': 'object', 'required': ['id']})
+        assert source.startswith('def validate(x):')
+        assert 'req_set' in source
+        with pytest.raises(ValueError):
+            compile_to_source({'items': {'type': 'string'}})
+
+    def test_branch_selection_cached_until_mutation(self, monkeypatch):
+        from schema2object.api import SchemaAPI
+        calls = []
+        original = SchemaAPI._match_branches
+
+        def counting(subs, data):
+            calls.append(1)
+            return original(subs, data)
+
+        monkeypatch.setattr(SchemaAPI, '_match_branches', staticmethod(counting))
+        schema = {'oneOf': [
+            {'properties': {'kind': {'const': 'a'}, 'inner': {'type': 'object'}}},
+            {'properties': {'kind': {'const': 'b'}}},
+        ]}
+        o = ObjectTree({'kind': 'a', 'inner': {'n': 1}}, schema=schema)
+        assert o.one_of().kind == 'a'
+        o.one_of()
+        o.project()
+        assert len(calls) == 1
+        o.inner.n = 2
+        o.one_of()
+        assert len(calls) == 2
+        o.kind = 'b'
+        assert o.one_of()._schema.properties.kind.const == 'b'
+        # Plain lists can change in place, so they disable the cache
+        listed = ObjectTree({'kind': 'a', 'tags': []}, schema=schema)
+        listed.one_of()
+        listed.one_of()
+        assert len(calls) == 5
+
+    def test_patterns_compiled_when_schema_attached(self):
+        from schema2object.api import _compile_pattern
+        _compile_pattern.cache_clear()
+        schema = {
+            'properties': {
+                'code': {'type': 'string', 'pattern': '^[A-Z]{3}$'},
+                'tags': {'items': {'pattern': 'x+y'}},
+            },
+            'patternProperties': {'^ext_': {'type': 'string'}},
+            'enum': [{'pattern': '('}],
+        }
+        ObjectTree({}, schema=schema)
+        assert _compile_pattern.cache_info().currsize == 3
+
+    def test_one_schema_tree_per_schema_dict(self):
+        from schema2object.api import _PREPPED
+        schema = {'properties': {'n': {'type': 'integer'}}}
+        a = ObjectTree({}, schema=schema)
+        prepped = len(_PREPPED._entries)
+        b = ObjectTree({'n': 1}, schema=schema)
+        assert a._schema is b._schema
+        assert len(_PREPPED._entries) == prepped
+        with pytest.raises(TypeError):
+            b.n = 'x'
+
+    def test_check_value_uses_compiled_validator(self):
+        from schema2object.api import _check_value, _validator_for
+        leaf = {'type': 'integer', 'minimum': 1}
+        obj = {'type': 'object', 'required': ['a']}
+        assert _validator_for(obj) is _validator_for(obj)
+        assert _check_value(leaf, 0) == (False, '0 < minimum 1')
+        assert _check_value(obj, {}) == (False, "missing required field 'a'")
+        assert _check_value(obj, {'a': 1}) == (True, '')
+
+    def test_code_generated_only_for_hot_schemas(self):
+        from schema2object.api import _JIT_AFTER, _JITS, _validator_for
+        schema = {'type': 'object', 'properties': {'a': {'type': 'integer'}}}
+        validate = _validator_for(schema)
+        for i in range(_JIT_AFTER - 1):
+            assert validate({'a': i}) == (True, '')
+        assert _JITS.get(schema) is None
+        assert validate({'a': 'x'}) == (False, ".a: expected type 'integer', got str")
+        assert _JITS.get(schema) is not None
+        assert validate({'a': 'x'}) == (False, ".a: expected type 'integer', got str")
+
+    def test_compiled_schema_struct(self):
+        from schema2object.api import _compiled_schema
+        schema = ObjectTree({'type': 'array', 'items': {'type': 'integer'},
+                             'contains': {'minimum': 5}})
+        cs = _compiled_schema(schema)
+        assert _compiled_schema(schema) is cs
+        assert cs.type_ == 'array'
+        assert cs.items is schema['items'] and cs.contains is schema['contains']
+        assert cs.properties is None and cs.required is None and cs.additional is None
+        assert cs.validate([1, 5]) == (True, '')
+        obj = _compiled_schema({'properties': {'a': {}}, 'required': ['a'],
+                                'additionalProperties': False})
+        assert obj.required == frozenset({'a'}) and obj.additional is False
+        o = ObjectTree([1, 6], schema=schema)
+        assert o.contains()
+        with pytest.raises(TypeError):
+            o[0] = 'x'
+
+    def test_property_leaf_results_memoized(self, monkeypatch):
+        from schema2object import api
+        schema = {'properties': {'n': {'type': 'integer', 'maximum': 5},
+                                 'tags': {'items': {'type': 'string'}}}}
+        validate = api.compile(schema)
+        assert validate({'n': 1, 'tags': ['a']}) == (True, '')
+        calls = []
+        original = api._run_plan
+        monkeypatch.setattr(api, '_run_plan', lambda plan, v: calls.append(v) or original(plan, v))
+        assert validate({'n': 1, 'tags': ['b']}) == (True, '')
+        assert calls == [['b']]
+        assert validate({'n': True})[1] == ".n: expected type 'integer', got bool"
+        assert validate({'n': 1.0})[0] is False
+        assert validate({'n': 6}) == (False, '.n: 6 > maximum 5')
+        calls.clear()
+        long = 'x' * 65
+        assert validate({'tags': long}) == validate({'tags': long}) == (True, '')
+        assert calls == [long, long]
+
+    def test_public_compile(self):
+        from schema2object.api import _check_value, compile
+        schema = {'type': 'object', 'required': ['n'],
+                  'properties': {'n': {'type': 'integer', 'multipleOf': 2}}}
+        validate = compile(schema)
+        assert compile(schema) is validate
+        assert validate({'n': 4}) == (True, '')
+        assert validate({'n': 3}) == _check_value(schema, {'n': 3}) == (
+            False, '.n: 3 is not a multiple of 2')
+        assert validate(ObjectTree({'n': 2})) == (True, '')
+        assert compile({'minimum': 0})(-1) == (False, '-1 < minimum 0')
+        with pytest.raises(TypeError):
+            compile(True)
+
+    def test_compile_boolean_errors(self):
+        from schema2object.api import compile
+        schema = {'type': 'object', 'required': ['n'],
+                  'properties': {'n': {'type': 'integer', 'minimum': 0}}}
+        is_valid = compile(schema, errors='boolean')
+        assert compile(schema, errors='boolean') is is_valid
+        assert is_valid({'n': 1}) == (True, '')
+        assert is_valid({'n': -1}) == (False, None)
+        assert is_valid({}) == (False, None)
+        assert is_valid(ObjectTree({'n': 2}))[0]
+        # Schemas outside the generator fall back to the plan's verdict
+        items = compile({'items': {'type': 'string'}}, errors='boolean')
+        assert items(['a']) == (True, '') and items([1]) == (False, None)
+        with pytest.raises(ValueError):
+            compile(schema, errors='quiet')
+
+    def test_composition_fields_on_compiled_schema(self):
+        from schema2object.api import _compiled_schema
+        schema = ObjectTree({'oneOf': [{'type': 'integer'}], 'anyOf': [],
+                             'if': {'minimum': 5}, 'then': {'maximum': 9}, 'not': {}})
+        cs = _compiled_schema(schema)
+        assert cs.one_of is schema['oneOf']
+        assert cs.any_of is None and cs.all_of is None and cs.else_ is None
+        assert cs.if_ is schema['if'] and cs.then is schema['then']
+        assert cs.not_ is schema['not']
+        o = ObjectTree(7, schema=schema)
+        assert o.one_of()._schema is schema['oneOf'][0]
+        assert o.any_of() == [o]
+        assert o.if_then()._schema is schema['then']
+        assert ObjectTree(1, schema=schema).if_then()._data == 1
+
+    def test_scalar_results_memoized(self):
+        from schema2object.api import _check_value, _compiled_schema
+        schema = {'type': 'integer', 'maximum': 5}
+        cached = _compiled_schema(schema).validate_scalar
+        assert _check_value(schema, 3) == (True, '')
+        assert _check_value(schema, 3) == (True, '')
+        assert cached.cache_info().hits == 1
+        assert _check_value(schema, True) == (False, "expected type 'integer', got bool")
+        assert _check_value(schema, 3.0)[0] is False
+        assert _check_value(schema, 9) == (False, '9 > maximum 5')
+        assert _check_value(schema, [3])[0] is False
+        assert cached.cache_info().currsize == 4
+
+    def test_long_strings_not_memoized(self):
+        from schema2object.api import _check_value, _compiled_schema
+        schema = {'type': 'string', 'maxLength': 100}
+        cached = _compiled_schema(schema).validate_scalar
+        assert _check_value(schema, 'x' * 64)[0]
+        assert _check_value(schema, 'x' * 65)[0]
+        assert not _check_value(schema, 'x' * 101)[0]
+        assert cached.cache_info().currsize == 1
+
+    def test_required_reports_first_missing_in_order(self):
+        from schema2object.api import _check_value
+        schema = {'required': ['a', 'b', 'c']}
+        assert _check_value(schema, {'a': 1, 'b': 2, 'c': 3, 'd': 4})[0]
+        ok, reason = _check_value(schema, {'a': 1})
+        assert not ok
+        assert reason == "missing required field 'b'"
+        assert _check_value(schema, {'a': 1, 'b': 2})[1] == "missing required field 'c'"
+        deps = {'dependencies': {'a': {'required': ['y', 'x']}}}
+        assert _check_value(deps, {'a': 1})[1] == "dependency 'a': missing required field 'y'"
+
+    def test_enum_hashable_and_unhashable(self):
+        from schema2object.api import _check_value
+        assert _check_value({'enum': ['a', 'b']}, 'b')[0]
+        assert not _check_value({'enum': ['a', 'b']}, ['a'])[0]
+        assert _check_value({'enum': [[1, 2], {'k': 1}]}, {'k': 1})[0]
+        assert not _check_value({'enum': [[1, 2], {'k': 1}]}, [2, 1])[0]
+
+    def test_objecttree_schema_compiles_from_plain_copy(self):
+        from schema2object.api import _check_value
+        schema = ObjectTree({'properties': {'n': {'enum': [1, 2]}}, 'required': ['n']})
+        assert _check_value(schema, {'n': 2})[0]
+        assert not _check_value(schema, {'n': 3})[0]
+        assert not _check_value(schema, {})[0]
+
+    def test_all_of_merge_cached(self):
+        schema = {'allOf': [{'properties': {'a': {'type': 'integer'}}}]}
+        o = ObjectTree({'a': 1}, schema=schema)
+        first = object.__getattribute__(o.all_of(), '_schema')
+        second = object.__getattribute__(o.all_of(), '_schema')
+        assert first is second
+
+    def test_items_validated(self):
+        from schema2object.api import _check_value
+        schema = {'type': 'array', 'items': {'type': 'integer', 'minimum': 0}}
+        assert _check_value(schema, [0, 1, 2])[0]
+        ok, reason = _check_value(schema, [0, -1, 'x'])
+        assert not ok
+        assert reason.startswith('[1]:')
+        assert 'minimum' in reason
+
+    def test_items_binding_on_assignment(self):
+        schema = {'properties': {'tags': {'type': 'array', 'items': {'type': 'string'}}}}
+        o = ObjectTree({}, schema=schema)
+        o.tags = ['a', 'b']
+        with pytest.raises(TypeError, match=r"\[1\]"):
+            o.tags = ['a', 2]
+
+    def test_contains_keyword_validated(self):
+        from schema2object.api import _check_value
+        schema = {'contains': {'type': 'string'}}
+        assert _check_value(schema, [1, 'a'])[0]
+        ok, reason = _check_value(schema, [1, 2])
+        assert not ok
+        assert 'contains' in reason
+
+    def test_flattened_properties_paths(self):
+        from schema2object.api import _check_value, _flatten_properties
+        props = {
+            'a': {'description': 'container', 'properties': {
+                'b': {'properties': {'c': {'type': 'integer'}}},
+                'd': {'type': 'string'},
+            }},
+            'e': {},
+        }
+        assert [path for path, _ in _flatten_properties(props, ())] == [('a', 'b', 'c'), ('a', 'd')]
+        schema = {'properties': props}
+        assert _check_value(schema, {'a': {'b': 'not-a-dict'}})[0]
+        ok, reason = _check_value(schema, {'a': {'b': {'c': 'x'}}})
+        assert not ok
+        assert reason.startswith('.a: .b: .c: ')
+
+    def test_literal_patterns_match_regex_semantics(self):
+        import re
+        from schema2object.api import _LiteralPattern, _compile_pattern
+        samples = ['foo', 'xfoo', 'foox', 'foo\n', 'fo', '', 'a_id', 'a_id\n', '_idx']
+        for pat in ['foo', '^foo', 'foo$', '^foo$', '_id$']:
+            matcher = _compile_pattern(pat)
+            assert isinstance(matcher, _LiteralPattern)
+            for s in samples:
+                assert bool(matcher.search(s)) == bool(re.search(pat, s)), (pat, s)
+        assert not isinstance(_compile_pattern('^[A-Z]'), _LiteralPattern)
+
+    def test_anchored_patterns_use_match(self):
+        import re
+        from schema2object.api import _AnchoredPattern, _compile_pattern
+        samples = ['Abc', 'abc', 'a@b', 'x\nAbc', '@@', 'a@b\n', '']
+        for pat in ['^[A-Z]', '^[^@]+@[^@]+$', '^\\d+$']:
+            matcher = _compile_pattern(pat)
+            assert isinstance(matcher, _AnchoredPattern)
+            assert matcher.pattern == pat
+            for s in samples:
+                assert bool(matcher.search(s)) == bool(re.search(pat, s)), (pat, s)
+        for pat in ['^a|b', '(?m)^b', '[A-Z]$']:
+            assert not isinstance(_compile_pattern(pat), _AnchoredPattern)
+
+
+# === Columnar record store ===
+
+class TestColumnar:
+    SCHEMA = {
+        'type': 'array',
+        'items': {
+            'type': 'object',
+            'properties': {
+                'id': {'type': 'integer'},
+                'name': {'type': 'string'},
+                'meta': {'type': 'object'},
+            },
+        },
+    }
+
+    def test_rows_and_columns(self):
+        from schema2object import ObjectTreeColumnar
+        rows = [{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b', 'meta': {'x': 1}}]
+        col = ObjectTreeColumnar(rows, schema=self.SCHEMA)
+        assert len(col) == 2
+        assert col[0].id == 1 and col[-1].name == 'b'
+        assert col[1].meta.x == 1
+        assert col.column('id') == [1, 2]
+        assert col.column('meta')[0] is None
+        assert 'meta' not in col[0]
+        with pytest.raises(AttributeError):
+            col[0].meta
+        assert col.to_dict() == rows
+        assert [r.id for r in col] == [1, 2]
+
+    def test_writes_type_checked(self):
+        from schema2object import ObjectTreeColumnar
+        col = ObjectTreeColumnar([{'id': 1}], schema=self.SCHEMA)
+        col[0].id = 5
+        assert col.column('id') == [5]
+        with pytest.raises(TypeError):
+            col[0].id = 'bad'
+        with pytest.raises(TypeError):
+            col[0].unknown = 1
+        with pytest.raises(ValueError):
+            col.append({'id': 2, 'extra': True})
+
+    def test_requires_item_properties(self):
+        from schema2object import ObjectTreeColumnar
+        with pytest.raises(ValueError):
+            ObjectTreeColumnar([], schema={'type': 'array'})
+
+    def test_inside_objecttree(self):
+        from schema2object import ObjectTreeColumnar
+        schema = {'properties': {'records': self.SCHEMA}}
+        o = ObjectTree({}, schema=schema)
+        o.records = ObjectTreeColumnar([{'id': 1}], schema=self.SCHEMA)
+        assert isinstance(o.records, ObjectTreeColumnar)
+        assert o.to_dict() == {'records': [{'id': 1}]}
+        assert json.loads(dumps(o)) == {'records': [{'id': 1}]}
+        assert json.loads(json.dumps({'r': o.records}, cls=ObjectTreeEncoder)) == {'r': [{'id': 1}]}
+        capped = ObjectTree({}, schema={'properties': {'records': dict(self.SCHEMA, maxItems=1)}})
+        with pytest.raises(TypeError):
+            capped.records = ObjectTreeColumnar([{'id': 1}, {'id': 2}], schema=self.SCHEMA)